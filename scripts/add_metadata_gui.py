@@ -5,7 +5,17 @@ Import VFX shot codes from Excel to timeline subtitles and add frame counters
 
 import sys
 import os
+import re
+import stat
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from concurrent.futures.process import BrokenProcessPool
+from fractions import Fraction
+from functools import lru_cache
 from pathlib import Path
+from xml.etree import ElementTree
 from timecode import Timecode
 
 from PySide6.QtWidgets import (
@@ -14,24 +24,37 @@ from PySide6.QtWidgets import (
     QMessageBox, QProgressBar, QTextEdit, QCheckBox, QGroupBox,
     QSpinBox, QDoubleSpinBox, QScrollArea
 )
-from PySide6.QtCore import Qt, QThread, Signal, QUrl
-from PySide6.QtGui import QFont, QDesktopServices, QIcon
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, Slot, QUrl
+from PySide6.QtGui import QFont, QDesktopServices, QIcon, QTextCursor
 
-from openpyxl import load_workbook
-from openpyxl.utils import column_index_from_string, get_column_letter
+# openpyxl is imported where it's used: it costs ~100 ms and the fast header
+# read on startup (and calamine, when installed) never needs it
 
-# Import DaVinci Resolve API
+# Optional Rust-backed xlsx reader; openpyxl's read-only stream is used without it
 try:
-    import DaVinciResolveScript as dvr
+    from python_calamine import CalamineWorkbook
 except ImportError:
-    import sys
-    resolve_script_api = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules"
-    if resolve_script_api not in sys.path:
-        sys.path.append(resolve_script_api)
+    CalamineWorkbook = None
+
+RESOLVE_SCRIPT_API = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules"
+
+
+def load_dvr():
+    """Import the DaVinci Resolve API on first use; returns None if unavailable.
+
+    Loading DaVinciResolveScript pulls in the fusionscript library, so it is
+    deferred to the worker threads rather than paid for at window startup.
+    """
     try:
         import DaVinciResolveScript as dvr
     except ImportError:
-        dvr = None
+        if RESOLVE_SCRIPT_API not in sys.path:
+            sys.path.append(RESOLVE_SCRIPT_API)
+        try:
+            import DaVinciResolveScript as dvr
+        except ImportError:
+            dvr = None
+    return dvr
 
 
 def get_timeline_fps(timeline):
@@ -47,11 +70,433 @@ def fps_to_str(fps):
         return str(int(round(fps)))
     return f"{fps:.3f}".rstrip('0').rstrip('.')
 
+
+# Above this many selected columns, SRT/FCPXML formatting is fanned out to processes
+PARALLEL_COLUMN_THRESHOLD = 2
+# How long the window waits for a worker that has just reported done before closing
+CLOSE_WAIT_MS = 2000
+
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_XLSX_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_CELL_REF_RE = re.compile(r"([A-Z]+)(\d+)")
+_TC_RE = re.compile(r"(\d+):(\d+):(\d+)[:;](\d+)")
+
+
+def column_number(letters):
+    """Spreadsheet column letters to a 1-based index: "A" -> 1, "AA" -> 27."""
+    number = 0
+    for ch in letters:
+        number = number * 26 + ord(ch) - 64
+    return number
+
+
+def column_letter(number):
+    """1-based column index to spreadsheet letters: 1 -> "A", 27 -> "AA"."""
+    letters = ""
+    while number:
+        number, rem = divmod(number - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _active_sheet_index(workbook):
+    """Return the position of the active worksheet in a parsed workbook.xml."""
+    view = workbook.find(f"{_XLSX_NS}bookViews/{_XLSX_NS}workbookView")
+    if view is not None:
+        return int(view.get("activeTab", 0))
+    return 0
+
+
+def _active_sheet_part(zf):
+    """Return the zip member name of the workbook's active worksheet."""
+    workbook = ElementTree.fromstring(zf.read("xl/workbook.xml"))
+    sheets = workbook.findall(f"{_XLSX_NS}sheets/{_XLSX_NS}sheet")
+    rel_id = sheets[_active_sheet_index(workbook)].get(f"{_XLSX_REL_NS}id")
+
+    rels = ElementTree.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels:
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target")
+            return target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+    raise KeyError(rel_id)
+
+
+def _read_shared_strings(zf, count):
+    """Read the first `count` entries of the shared string table."""
+    strings = []
+    if count <= 0 or "xl/sharedStrings.xml" not in zf.namelist():
+        return strings
+    with zf.open("xl/sharedStrings.xml") as f:
+        for _, elem in ElementTree.iterparse(f):
+            if elem.tag == f"{_XLSX_NS}si":
+                # Rich text splits a string across several <t> runs
+                strings.append("".join(t.text or "" for t in elem.iter(f"{_XLSX_NS}t")))
+                elem.clear()
+                if len(strings) >= count:
+                    break
+    return strings
+
+
+def _read_header_row(sheet_path):
+    """Return the first row of the active sheet as a tuple of cell values.
+
+    Streams the worksheet XML straight out of the xlsx zip and stops at the end
+    of row 1, so large workbooks don't pay for openpyxl's workbook setup. Falls
+    back to openpyxl if the file layout is anything unexpected.
+    """
+    try:
+        with zipfile.ZipFile(sheet_path) as zf:
+            cells = {}
+            with zf.open(_active_sheet_part(zf)) as f:
+                for _, elem in ElementTree.iterparse(f):
+                    if elem.tag == f"{_XLSX_NS}c":
+                        col_letters, row_num = _CELL_REF_RE.match(elem.get("r")).groups()
+                        if row_num != "1":
+                            break
+                        cell_type = elem.get("t", "n")
+                        if cell_type == "inlineStr":
+                            value = "".join(t.text or "" for t in elem.iter(f"{_XLSX_NS}t"))
+                        else:
+                            value = elem.findtext(f"{_XLSX_NS}v")
+                        if value is not None:
+                            cells[column_number(col_letters) - 1] = (cell_type, value)
+                    elif elem.tag == f"{_XLSX_NS}row":
+                        break
+
+            shared_indices = [int(v) for t, v in cells.values() if t == "s"]
+            shared = _read_shared_strings(zf, max(shared_indices) + 1 if shared_indices else 0)
+
+        headers = [None] * (max(cells) + 1 if cells else 0)
+        for col_idx, (cell_type, value) in cells.items():
+            if cell_type == "s":
+                headers[col_idx] = shared[int(value)]
+            elif cell_type == "b":
+                headers[col_idx] = value == "1"
+            elif cell_type == "n":
+                headers[col_idx] = float(value) if any(c in value for c in ".eE") else int(value)
+            else:
+                headers[col_idx] = value
+        return tuple(headers)
+
+    except (KeyError, IndexError, ValueError, TypeError, AttributeError,
+            zipfile.BadZipFile, ElementTree.ParseError):
+        from openpyxl import load_workbook
+        wb = load_workbook(sheet_path, read_only=True, data_only=True)
+        try:
+            return next(wb.active.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        finally:
+            wb.close()
+
+
+def _calamine_value(value):
+    """Map a calamine cell value onto what openpyxl would have returned."""
+    if value == "":
+        return None
+    # xlsx stores every number as a float; openpyxl hands whole numbers back as int
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _read_sheet_rows(sheet_path, max_col):
+    """Return the active sheet's data rows (row 2 onward), cut to max_col columns.
+
+    Uses python-calamine when it is installed and falls back to openpyxl's
+    read-only stream otherwise, or if calamine can't read the file.
+    """
+    if CalamineWorkbook is not None:
+        try:
+            with zipfile.ZipFile(sheet_path) as zf:
+                active = _active_sheet_index(ElementTree.fromstring(zf.read("xl/workbook.xml")))
+            sheet = CalamineWorkbook.from_path(sheet_path).get_sheet_by_index(active)
+            pad = (None,) * max_col
+            return [
+                (tuple(_calamine_value(v) for v in row[:max_col]) + pad)[:max_col]
+                for row in sheet.to_python(skip_empty_area=False)[1:]
+            ]
+        except Exception:
+            pass
+
+    from openpyxl import load_workbook
+    wb = load_workbook(sheet_path, read_only=True, data_only=True)
+    try:
+        return list(wb.active.iter_rows(min_row=2, max_col=max_col, values_only=True))
+    finally:
+        wb.close()
+
+
+def _path_kind(path, cache):
+    """Return "dir", "file" or None for a path, stat-ing each distinct path only once."""
+    path = os.fspath(path)
+    if path not in cache:
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            cache[path] = None
+        else:
+            cache[path] = "dir" if stat.S_ISDIR(st.st_mode) else "file"
+    return cache[path]
+
+
+def _probe_sheet(sheet_path):
+    """Cheaply confirm the workbook opens and has a sheet. Returns (ok, error)."""
+    from openpyxl import load_workbook
+    try:
+        wb = load_workbook(sheet_path, read_only=True, data_only=True)
+    except Exception as e:
+        return False, str(e)
+    try:
+        if not wb.sheetnames:
+            return False, "Workbook contains no sheets"
+        return True, None
+    finally:
+        wb.close()
+
+
+def project_columns(rows, column_indices):
+    """Cut each row down to the given columns, in order.
+
+    Returns (rows, position) where position maps an original column index to
+    its index in the projected rows.
+    """
+    if len(column_indices) == 1:
+        only = column_indices[0]
+        projected = [(row[only],) for row in rows]
+    else:
+        pick = itemgetter(*column_indices)
+        projected = [pick(row) for row in rows]
+    return projected, {col: pos for pos, col in enumerate(column_indices)}
+
+
+@lru_cache(maxsize=8)
+def timecode_parser(fps):
+    """Return a function mapping a timecode string to Timecode(fps, tc).frames.
+
+    Timecodes are parsed with a regex and integer arithmetic, applying the same
+    drop-frame correction Timecode does (2 frames per minute at 29.97, 4 at 59.94,
+    except every tenth minute). Anything the regex doesn't fully match goes through Timecode.
+
+    One parser is kept per rate and remembers recent timecodes, so the record
+    in/out cells shared by every exported column are only parsed once.
+    """
+    probe = Timecode(fps, "00:00:01:00")
+    base = probe.frames - 1
+    drop = round(float(probe.framerate) * 0.066666) if probe.drop_frame else 0
+    match = _TC_RE.fullmatch
+
+    def to_frames(tc):
+        if type(tc) is not str:
+            tc = str(tc)
+        m = match(tc)
+        if m is None:
+            return Timecode(fps, tc).frames
+        hh, mm, ss, ff = map(int, m.groups())
+        total_minutes = hh * 60 + mm
+        frames = (total_minutes * 60 + ss) * base + ff + 1
+        if drop:
+            frames -= drop * (total_minutes - total_minutes // 10)
+        return frames
+
+    return lru_cache(maxsize=8192)(to_frames)
+
+
+def read_column_entries(rows, column_index, fps, rec_in_col_idx, rec_out_col_idx):
+    """Collect (in_frames, out_frames, text) entries for rows with content in a specific column.
+
+    Frames are 1-based, as Timecode counts them. Timecodes are only parsed for
+    rows that have text. Rows must be fixed-width, as project_columns returns them.
+    """
+    to_frames = timecode_parser(fps)
+    entries = []
+    for row in rows:
+        content = row[column_index]
+        if not content:
+            continue
+        # Text cells are already str; only numbers, dates etc. need converting
+        text = (content if type(content) is str else str(content)).strip()
+        if text:
+            entries.append((to_frames(row[rec_in_col_idx]), to_frames(row[rec_out_col_idx]), text))
+    return entries
+
+def frames_to_srt_time(frames, fps_num, fps_den=1):
+    """Format a 1-based frame count as an SRT timestamp (HH:MM:SS,mmm) with integer math."""
+    total_ms = (frames - 1) * 1000 * fps_den // fps_num
+    h, rem = divmod(total_ms, 3600000)
+    m, rem = divmod(rem, 60000)
+    s, ms = divmod(rem, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+def create_srt_file(subtitles, output_path, fps):
+    """Create SRT file from a column's timed text entries."""
+    # Exact rational rate (23.976 -> 2997/125) so timestamps never pick up float error
+    rate = Fraction(float(fps)).limit_denominator(1001)
+    fps_num, fps_den = rate.numerator, rate.denominator
+
+    def to_srt(frames):
+        return frames_to_srt_time(frames, fps_num, fps_den)
+
+    # Stream one encoded block per subtitle; the full file is never held in memory
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        f.writelines(
+            f"{idx}\n{to_srt(in_frames)} --> {to_srt(out_frames)}\n{text}\n\n".encode('utf-8')
+            for idx, (in_frames, out_frames, text) in enumerate(subtitles, start=1)
+        )
+
+    return output_path
+
+def create_fcpxml_file(titles, output_path, column_name, fps):
+    """Create FCPXML file with Basic Title elements from a column's timed text entries."""
+
+    # Determine frame rate string for FCPXML
+    if abs(fps - 23.976) < 0.001:
+        frame_duration = "1001/24000s"
+        rate_denominator = 24000
+        frame_numerator = 1001
+    elif abs(fps - 24) < 0.001:
+        frame_duration = "1/24s"
+        rate_denominator = 2400
+        frame_numerator = 100
+    elif abs(fps - 25) < 0.001:
+        frame_duration = "1/25s"
+        rate_denominator = 2500
+        frame_numerator = 100
+    elif abs(fps - 29.97) < 0.001:
+        frame_duration = "1001/30000s"
+        rate_denominator = 30000
+        frame_numerator = 1001
+    elif abs(fps - 30) < 0.001:
+        frame_duration = "1/30s"
+        rate_denominator = 3000
+        frame_numerator = 100
+    elif abs(fps - 60) < 0.001:
+        frame_duration = "1/60s"
+        rate_denominator = 6000
+        frame_numerator = 100
+    else:
+        # Generic fallback
+        frame_duration = f"1/{int(fps)}s"
+        rate_denominator = int(fps * 100)
+        frame_numerator = 100
+
+    # Calculate total duration
+    _, last_out_frames, _ = titles[-1]
+    total_duration_frames = last_out_frames * frame_numerator
+
+    # Build FCPXML
+    lines = []
+    lines.append('<?xml version="1.0" encoding="UTF-8"?>')
+    lines.append('<!DOCTYPE fcpxml>')
+    lines.append('<fcpxml version="1.9">')
+    lines.append('  <resources>')
+    lines.append(f'    <format id="r1" name="FFVideoFormat1080p{int(fps)}" frameDuration="{frame_duration}" width="1920" height="1080" colorSpace="1-1-1 (Rec. 709)"/>')
+    lines.append('    <effect id="r2" name="Basic Title" uid=".../Titles.localized/Bumper:Opener.localized/Basic Title.localized/Basic Title.moti"/>')
+    lines.append('  </resources>')
+    lines.append('  <library>')
+    lines.append(f'    <event name="{column_name}" uid="FA0976C2155BF5E1CD0AA20BD91F88B1">')
+    lines.append(f'      <project name="{column_name}" uid="A9CE7D528B481A850DDD48AF2D238B14" modDate="2026-02-02 20:24:21 +0000">')
+
+    # Calculate total duration in fractional format
+    total_duration_str = f"{total_duration_frames}/{rate_denominator}s"
+    lines.append(f'        <sequence format="r1" duration="{total_duration_str}" tcStart="0/{int(fps)}s" tcFormat="NDF" audioLayout="stereo" audioRate="48k">')
+    lines.append('          <spine>')
+    lines.append(f'            <gap name="Gap" offset="0s" start="0s" duration="{total_duration_str}">')
+
+    # Add each title
+    for idx, (in_frames, out_frames, text) in enumerate(titles, start=1):
+
+        # Convert timecodes to frames (0-indexed) and multiply by frame numerator
+        offset_frames = (in_frames - 1) * frame_numerator
+        start_frames = (in_frames - 1) * frame_numerator
+        duration_frames = (out_frames - in_frames) * frame_numerator
+
+        # Format as fractions
+        offset_str = f"{offset_frames}/{rate_denominator}s"
+        start_str = f"{start_frames}/{rate_denominator}s"
+        duration_str = f"{duration_frames}/{rate_denominator}s"
+
+        ts_id = f"ts{idx}"
+
+        lines.append(f'              <title ref="r2" lane="0" name="{text} - Basic Title" offset="{offset_str}" start="{start_str}" duration="{duration_str}">')
+        lines.append('                <param name="Flatten" key="9999/999166631/999166633/2/351" value="1"/>')
+        lines.append('                <param name="Alignment" key="9999/999166631/999166633/2/354/3142713059/401" value="1 (Center)"/>')
+        lines.append('                <param name="Alignment" key="9999/999166631/999166633/2/354/999169573/401" value="1 (Center)"/>')
+        lines.append('                <text>')
+        lines.append(f'                  <text-style ref="{ts_id}">{text}</text-style>')
+        lines.append('                </text>')
+        lines.append(f'                <text-style-def id="{ts_id}">')
+        lines.append('                  <text-style font="Helvetica" fontSize="60" fontColor="1 1 1 1" alignment="center" fontFace="Regular"/>')
+        lines.append('                </text-style-def>')
+        lines.append('              </title>')
+
+    lines.append('            </gap>')
+    lines.append('          </spine>')
+    lines.append('        </sequence>')
+    lines.append('      </project>')
+    lines.append('    </event>')
+    lines.append('    <smart-collection name="Projects" match="all">')
+    lines.append('      <match-clip rule="is" type="project"/>')
+    lines.append('    </smart-collection>')
+    lines.append('    <smart-collection name="All Video" match="any">')
+    lines.append('      <match-media rule="is" type="videoOnly"/>')
+    lines.append('      <match-media rule="is" type="videoWithAudio"/>')
+    lines.append('    </smart-collection>')
+    lines.append('    <smart-collection name="Audio Only" match="all">')
+    lines.append('      <match-media rule="is" type="audioOnly"/>')
+    lines.append('    </smart-collection>')
+    lines.append('    <smart-collection name="Stills" match="all">')
+    lines.append('      <match-media rule="is" type="stills"/>')
+    lines.append('    </smart-collection>')
+    lines.append('    <smart-collection name="Favorites" match="all">')
+    lines.append('      <match-ratings value="favorites"/>')
+    lines.append('    </smart-collection>')
+    lines.append('  </library>')
+    lines.append('</fcpxml>')
+
+    # Write FCPXML file in one syscall, skipping the text layer
+    with open(output_path, 'wb') as f:
+        f.write('\n'.join(lines).encode('utf-8'))
+
+    return output_path
+
+def emit_column(rows, column_index, column_name, srt_path, fcpxml_path,
+                fps, rec_in_col_idx, rec_out_col_idx):
+    """Write the SRT and/or FCPXML outputs for one column from a single row scan.
+
+    Returns (srt_path, fcpxml_path) for the files actually written.
+    """
+    entries = read_column_entries(rows, column_index, fps, rec_in_col_idx, rec_out_col_idx)
+    if not entries:
+        return None, None
+
+    srt_written = create_srt_file(entries, srt_path, fps) if srt_path else None
+    fcpxml_written = create_fcpxml_file(entries, fcpxml_path, column_name, fps) if fcpxml_path else None
+    return srt_written, fcpxml_written
+
+
+# Column export state for pool processes, set once per process by the initializer
+_pool_rows = None
+_pool_timing = None
+
+
+def _init_column_process(rows, fps, rec_in_col_idx, rec_out_col_idx):
+    global _pool_rows, _pool_timing
+    _pool_rows = rows
+    _pool_timing = (fps, rec_in_col_idx, rec_out_col_idx)
+
+
+def _emit_column_process(column_index, column_name, srt_path, fcpxml_path):
+    return emit_column(_pool_rows, column_index, column_name, srt_path, fcpxml_path, *_pool_timing)
+
+
 class MetadataWorker(QThread):
     """Threaded worker for processing metadata and frame counters."""
     progress = Signal(str)
     finished = Signal(bool, str)
     
+    # Log lines are sent to the GUI in batches of up to this many lines / seconds
+    LOG_BATCH_LINES = 64
+    LOG_BATCH_SECONDS = 0.1
+    
     def __init__(self, sheet_path, selected_columns, srt_enabled, srt_output_dir,
                  fcpxml_enabled, fcpxml_output_dir, fps,
                  rec_in_col_idx, rec_out_col_idx,
@@ -70,189 +515,59 @@ class MetadataWorker(QThread):
         self.frame_counter_path = frame_counter_path
         self.first_frame = first_frame
         self.shot_code_col_idx = shot_code_col_idx
+        self._pending = []
+        self._last_flush = 0.0
+        self._rows = None
+        self._rows_width = 0
     
     def log(self, msg):
-        self.progress.emit(msg)
+        self._pending.append(msg)
+        if (len(self._pending) >= self.LOG_BATCH_LINES
+                or time.monotonic() - self._last_flush >= self.LOG_BATCH_SECONDS):
+            self.flush_log()
     
-    def create_srt_file(self, ws, output_path, column_index):
-        """Create SRT file from specific Excel column."""
-        
-        # Read data from Excel
-        subtitles = []
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if len(row) <= column_index:
-                continue
-            
-            content = row[column_index]
-            if content and str(content).strip():
-                subtitles.append({
-                    'tc_in': Timecode(self.fps, str(row[self.rec_in_col_idx])),
-                    'tc_out': Timecode(self.fps, str(row[self.rec_out_col_idx])),
-                    'text': str(content).strip()
-                })
-        
-        if not subtitles:
-            return None
-        
-        # Create SRT content
-        srt_lines = []
-        for idx, sub in enumerate(subtitles, start=1):
-            # Convert to SRT format: HH:MM:SS,mmm
-            def to_srt(tc):
-                total_sec = (tc.frames - 1) / float(tc.framerate)
-                h = int(total_sec // 3600)
-                m = int((total_sec % 3600) // 60)
-                s = int(total_sec % 60)
-                ms = int((total_sec % 1) * 1000)
-                return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
-            
-            srt_lines.append(str(idx))
-            srt_lines.append(f"{to_srt(sub['tc_in'])} --> {to_srt(sub['tc_out'])}")
-            srt_lines.append(sub['text'])
-            srt_lines.append("")
-        
-        # Write SRT file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(srt_lines))
-        
-        return output_path
+    def flush_log(self):
+        """Send buffered log lines to the GUI as a single progress signal."""
+        if self._pending:
+            self.progress.emit("\n".join(self._pending))
+            self._pending.clear()
+        self._last_flush = time.monotonic()
     
-    def create_fcpxml_file(self, ws, output_path, column_index, column_name):
-        """Create FCPXML file with Basic Title elements from specific Excel column."""
-        
-        # Read data from Excel
-        titles = []
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if len(row) <= column_index:
-                continue
-            
-            content = row[column_index]
-            if content and str(content).strip():
-                titles.append({
-                    'tc_in': Timecode(self.fps, str(row[self.rec_in_col_idx])),
-                    'tc_out': Timecode(self.fps, str(row[self.rec_out_col_idx])),
-                    'text': str(content).strip()
-                })
-        
-        if not titles:
-            return None
-        
-        # Determine frame rate string for FCPXML
-        fps = self.fps
-        if abs(fps - 23.976) < 0.001:
-            frame_duration = "1001/24000s"
-            rate_denominator = 24000
-            frame_numerator = 1001
-        elif abs(fps - 24) < 0.001:
-            frame_duration = "1/24s"
-            rate_denominator = 2400
-            frame_numerator = 100
-        elif abs(fps - 25) < 0.001:
-            frame_duration = "1/25s"
-            rate_denominator = 2500
-            frame_numerator = 100
-        elif abs(fps - 29.97) < 0.001:
-            frame_duration = "1001/30000s"
-            rate_denominator = 30000
-            frame_numerator = 1001
-        elif abs(fps - 30) < 0.001:
-            frame_duration = "1/30s"
-            rate_denominator = 3000
-            frame_numerator = 100
-        elif abs(fps - 60) < 0.001:
-            frame_duration = "1/60s"
-            rate_denominator = 6000
-            frame_numerator = 100
-        else:
-            # Generic fallback
-            frame_duration = f"1/{int(fps)}s"
-            rate_denominator = int(fps * 100)
-            frame_numerator = 100
-        
-        # Calculate total duration
-        last_out = titles[-1]['tc_out']
-        total_duration_frames = last_out.frames * frame_numerator
-        
-        # Build FCPXML
-        lines = []
-        lines.append('<?xml version="1.0" encoding="UTF-8"?>')
-        lines.append('<!DOCTYPE fcpxml>')
-        lines.append('<fcpxml version="1.9">')
-        lines.append('  <resources>')
-        lines.append(f'    <format id="r1" name="FFVideoFormat1080p{int(fps)}" frameDuration="{frame_duration}" width="1920" height="1080" colorSpace="1-1-1 (Rec. 709)"/>')
-        lines.append('    <effect id="r2" name="Basic Title" uid=".../Titles.localized/Bumper:Opener.localized/Basic Title.localized/Basic Title.moti"/>')
-        lines.append('  </resources>')
-        lines.append('  <library>')
-        lines.append(f'    <event name="{column_name}" uid="FA0976C2155BF5E1CD0AA20BD91F88B1">')
-        lines.append(f'      <project name="{column_name}" uid="A9CE7D528B481A850DDD48AF2D238B14" modDate="2026-02-02 20:24:21 +0000">')
-        
-        # Calculate total duration in fractional format
-        total_duration_str = f"{total_duration_frames}/{rate_denominator}s"
-        lines.append(f'        <sequence format="r1" duration="{total_duration_str}" tcStart="0/{int(fps)}s" tcFormat="NDF" audioLayout="stereo" audioRate="48k">')
-        lines.append('          <spine>')
-        lines.append(f'            <gap name="Gap" offset="0s" start="0s" duration="{total_duration_str}">')
-        
-        # Add each title
-        for idx, title in enumerate(titles, start=1):
-            text = title['text']
-            
-            # Convert timecodes to frames (0-indexed) and multiply by frame numerator
-            offset_frames = (title['tc_in'].frames - 1) * frame_numerator
-            start_frames = (title['tc_in'].frames - 1) * frame_numerator
-            duration_frames = (title['tc_out'].frames - title['tc_in'].frames) * frame_numerator
-            
-            # Format as fractions
-            offset_str = f"{offset_frames}/{rate_denominator}s"
-            start_str = f"{start_frames}/{rate_denominator}s"
-            duration_str = f"{duration_frames}/{rate_denominator}s"
-            
-            ts_id = f"ts{idx}"
-            
-            lines.append(f'              <title ref="r2" lane="0" name="{text} - Basic Title" offset="{offset_str}" start="{start_str}" duration="{duration_str}">')
-            lines.append('                <param name="Flatten" key="9999/999166631/999166633/2/351" value="1"/>')
-            lines.append('                <param name="Alignment" key="9999/999166631/999166633/2/354/3142713059/401" value="1 (Center)"/>')
-            lines.append('                <param name="Alignment" key="9999/999166631/999166633/2/354/999169573/401" value="1 (Center)"/>')
-            lines.append('                <text>')
-            lines.append(f'                  <text-style ref="{ts_id}">{text}</text-style>')
-            lines.append('                </text>')
-            lines.append(f'                <text-style-def id="{ts_id}">')
-            lines.append('                  <text-style font="Helvetica" fontSize="60" fontColor="1 1 1 1" alignment="center" fontFace="Regular"/>')
-            lines.append('                </text-style-def>')
-            lines.append('              </title>')
-        
-        lines.append('            </gap>')
-        lines.append('          </spine>')
-        lines.append('        </sequence>')
-        lines.append('      </project>')
-        lines.append('    </event>')
-        lines.append('    <smart-collection name="Projects" match="all">')
-        lines.append('      <match-clip rule="is" type="project"/>')
-        lines.append('    </smart-collection>')
-        lines.append('    <smart-collection name="All Video" match="any">')
-        lines.append('      <match-media rule="is" type="videoOnly"/>')
-        lines.append('      <match-media rule="is" type="videoWithAudio"/>')
-        lines.append('    </smart-collection>')
-        lines.append('    <smart-collection name="Audio Only" match="all">')
-        lines.append('      <match-media rule="is" type="audioOnly"/>')
-        lines.append('    </smart-collection>')
-        lines.append('    <smart-collection name="Stills" match="all">')
-        lines.append('      <match-media rule="is" type="stills"/>')
-        lines.append('    </smart-collection>')
-        lines.append('    <smart-collection name="Favorites" match="all">')
-        lines.append('      <match-ratings value="favorites"/>')
-        lines.append('    </smart-collection>')
-        lines.append('  </library>')
-        lines.append('</fcpxml>')
-        
-        # Write FCPXML file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-        
-        return output_path
+    def export_width(self):
+        """Number of leading columns the SRT/FCPXML export reads (0 if it won't run)."""
+        if not (self.selected_columns and (self.srt_enabled or self.fcpxml_enabled)):
+            return 0
+        return max(
+            max(col_idx for col_idx, _ in self.selected_columns),
+            self.rec_in_col_idx, self.rec_out_col_idx
+        ) + 1
+    
+    def sheet_rows(self, max_col):
+        """Data rows at least max_col wide, reading the sheet at most once per needed width.
+
+        Frame counters and the export share one read when both run.
+        """
+        if self._rows is None or self._rows_width < max_col:
+            self._rows = _read_sheet_rows(self.sheet_path, max_col)
+            self._rows_width = max_col
+        return self._rows
+    
+    def emit_columns_parallel(self, rows, jobs, rec_in_col_idx, rec_out_col_idx):
+        """Write each column's files in its own process; rows are shipped once per process."""
+        workers = min(len(jobs), os.cpu_count() or 1)
+        self.log(f"  Exporting {len(jobs)} columns across {workers} processes")
+        self.flush_log()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_column_process,
+            initargs=(rows, self.fps, rec_in_col_idx, rec_out_col_idx),
+        ) as pool:
+            return list(pool.map(_emit_column_process, *zip(*jobs)))
     
     def add_frame_counters(self):
         """Add frame counter videos to timeline based on shot timings from Excel."""
         
+        dvr = load_dvr()
         if not dvr:
             self.log("ERROR: DaVinci Resolve API not available")
             return False
@@ -269,6 +584,7 @@ class MetadataWorker(QThread):
             # Import frame counter to media pool
             abs_frame_counter_path = os.path.abspath(self.frame_counter_path)
             self.log(f"Importing frame counter: {abs_frame_counter_path}")
+            self.flush_log()
             imported = mediapool.ImportMedia([abs_frame_counter_path])
             if not imported:
                 self.log("ERROR: Failed to import frame counter video")
@@ -283,50 +599,66 @@ class MetadataWorker(QThread):
             self.log(f"Adding frame counters to track {target_track}")
             timeline.AddTrack("video", None)
             
-            # Load Excel to get shot timings
-            wb = load_workbook(self.sheet_path)
-            ws = wb.active
-            
-            # Read shot data
+            # Build one AppendToTimeline clip per shot row. Every clip starts at the same
+            # frame of the counter on the same track; only the length and record frame vary.
+            fps = self.fps
+            rec_in_col_idx = self.rec_in_col_idx
+            rec_out_col_idx = self.rec_out_col_idx
+            shot_code_col_idx = self.shot_code_col_idx
+            to_frames = timecode_parser(fps)
+            offset = self.first_frame - fc_first_frame
+            clip_template = {
+                "mediaPoolItem": frame_counter_item,
+                "startFrame": offset,
+                "trackIndex": target_track,
+            }
             clips_to_add = []
             shot_codes = []
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if len(row) < 5:
-                    continue
 
-                # Skip shots without a VFX shot code (non-VFX shots don't need frame counters)
-                if self.shot_code_col_idx is not None:
-                    if len(row) <= self.shot_code_col_idx:
-                        continue
-                    shot_code_val = row[self.shot_code_col_idx]
-                    if not shot_code_val or not str(shot_code_val).strip():
-                        continue
-                else:
-                    # No shot code column configured — fall back to any metadata in H+
-                    if not any(c and str(c).strip() for c in row[7:]):
+            # With a shot code column the row only needs to reach the furthest column read,
+            # and the read is widened to cover the export so the sheet is parsed once.
+            # Without one, any metadata in H+ counts, so the full width is streamed.
+            wb = None
+            if shot_code_col_idx is not None:
+                max_col = max(5, rec_in_col_idx + 1, rec_out_col_idx + 1, shot_code_col_idx + 1)
+                rows = self.sheet_rows(max(max_col, self.export_width()))
+            else:
+                from openpyxl import load_workbook
+                wb = load_workbook(self.sheet_path, read_only=True, data_only=True)
+                rows = wb.active.iter_rows(min_row=2, values_only=True)
+            try:
+                for row in rows:
+                    if len(row) < 5:
                         continue
 
-                record_tc_in = Timecode(self.fps, str(row[self.rec_in_col_idx]))
-                record_tc_out = Timecode(self.fps, str(row[self.rec_out_col_idx]))
-
-                shot_duration = record_tc_out.frames - record_tc_in.frames
-
-                clips_to_add.append({
-                    "mediaPoolItem": frame_counter_item,
-                    "startFrame": self.first_frame - fc_first_frame,
-                    "endFrame": self.first_frame - fc_first_frame + shot_duration,
-                    "trackIndex": target_track,
-                    "recordFrame": record_tc_in.frames - 1
-                })
+                    # Skip shots without a VFX shot code (non-VFX shots don't need frame counters)
+                    if shot_code_col_idx is not None:
+                        # Rows are padded out to max_col, so the shot code cell always exists
+                        shot_code_val = row[shot_code_col_idx]
+                        if not shot_code_val or not str(shot_code_val).strip():
+                            continue
+                        # Collect shot code for clip renaming
+                        shot_code = str(shot_code_val).strip()
+                    else:
+                        # No shot code column configured — fall back to any metadata in H+
+                        if not any(c and str(c).strip() for c in row[7:]):
+                            continue
+                        shot_code = ""
 
-                # Collect shot code for clip renaming
-                if self.shot_code_col_idx is not None:
-                    shot_code = str(shot_code_val).strip()
-                else:
-                    shot_code = ""
-                shot_codes.append(shot_code)
+                    in_frames = to_frames(row[rec_in_col_idx])
+                    out_frames = to_frames(row[rec_out_col_idx])
+                    clips_to_add.append({
+                        **clip_template,
+                        "endFrame": offset + (out_frames - in_frames),
+                        "recordFrame": in_frames - 1
+                    })
+                    shot_codes.append(shot_code)
+            finally:
+                if wb is not None:
+                    wb.close()
 
             self.log(f"Adding {len(clips_to_add)} frame counter clips...")
+            self.flush_log()
             result = mediapool.AppendToTimeline(clips_to_add)
 
             if result:
@@ -364,6 +696,7 @@ class MetadataWorker(QThread):
                 if self.add_frame_counters():
                     success_count += 1
                 else:
+                    self.flush_log()
                     self.finished.emit(False, "Frame counter addition failed")
                     return
             
@@ -373,27 +706,47 @@ class MetadataWorker(QThread):
                 self.log("Creating Subtitle Files")
                 self.log("=" * 50)
                 
-                # Load sheet
-                wb = load_workbook(self.sheet_path)
-                ws = wb.active
+                # Stream the sheet, then keep only the columns we actually use
+                needed = sorted(
+                    {col_idx for col_idx, _ in self.selected_columns}
+                    | {self.rec_in_col_idx, self.rec_out_col_idx}
+                )
+                rows, position = project_columns(self.sheet_rows(needed[-1] + 1), needed)
+                rec_in_col_idx = position[self.rec_in_col_idx]
+                rec_out_col_idx = position[self.rec_out_col_idx]
                 
                 # Create SRT and FCPXML files for each selected column
-                srt_count = 0
-                fcpxml_count = 0
+                jobs = []
                 for col_idx, col_name in self.selected_columns:
-                    # Create SRT file if enabled
+                    srt_output_path = None
                     if self.srt_enabled:
                         srt_output_path = os.path.join(self.srt_output_dir, f"{col_name}.srt")
-                        if self.create_srt_file(ws, srt_output_path, col_idx):
-                            self.log(f"  Created SRT: {srt_output_path}")
-                            srt_count += 1
-                    
-                    # Create FCPXML file if enabled
+                    fcpxml_output_path = None
                     if self.fcpxml_enabled:
                         fcpxml_output_path = os.path.join(self.fcpxml_output_dir, f"{col_name}.fcpxml")
-                        if self.create_fcpxml_file(ws, fcpxml_output_path, col_idx, col_name):
-                            self.log(f"  Created FCPXML: {fcpxml_output_path}")
-                            fcpxml_count += 1
+                    jobs.append((position[col_idx], col_name, srt_output_path, fcpxml_output_path))
+                
+                results = None
+                if len(jobs) > PARALLEL_COLUMN_THRESHOLD:
+                    try:
+                        results = self.emit_columns_parallel(rows, jobs, rec_in_col_idx, rec_out_col_idx)
+                    except (OSError, BrokenProcessPool) as e:
+                        self.log(f"  Parallel export unavailable ({e}), continuing in one process")
+                if results is None:
+                    results = [
+                        emit_column(rows, *job, self.fps, rec_in_col_idx, rec_out_col_idx)
+                        for job in jobs
+                    ]
+                
+                srt_count = 0
+                fcpxml_count = 0
+                for srt_written, fcpxml_written in results:
+                    if srt_written:
+                        self.log(f"  Created SRT: {srt_written}")
+                        srt_count += 1
+                    if fcpxml_written:
+                        self.log(f"  Created FCPXML: {fcpxml_written}")
+                        fcpxml_count += 1
                 
                 if srt_count > 0 or fcpxml_count > 0:
                     msg_parts = []
@@ -407,21 +760,71 @@ class MetadataWorker(QThread):
                     self.log("No files created (no data found in specified columns)")
             
             if success_count > 0:
+                self.flush_log()
                 self.finished.emit(True, "Processing completed successfully")
             else:
+                self.flush_log()
                 self.finished.emit(False, "No operations completed")
                 
         except Exception as e:
             self.log(f"ERROR: {str(e)}")
+            self.flush_log()
             self.finished.emit(False, str(e))
 
 
+class ResolveProbeWorker(QThread):
+    """One-shot Resolve connection check, kept off the GUI thread."""
+    result = Signal(str)
+    timeline_fps = Signal(float)
+    
+    def run(self):
+        dvr = load_dvr()
+        if dvr is None:
+            self.result.emit("⚠️  DaVinci Resolve API not available")
+            self.result.emit("    Frame counter feature will not work")
+            return
+        
+        try:
+            resolve = dvr.scriptapp("Resolve")
+            if not resolve:
+                self.result.emit("⚠️  Could not connect to Resolve")
+                return
+            project = resolve.GetProjectManager().GetCurrentProject()
+            if not project:
+                self.result.emit("⚠️  Connected to Resolve but no project open")
+                return
+            timeline = project.GetCurrentTimeline()
+            if not timeline:
+                self.result.emit("⚠️  Connected to Resolve but no timeline open")
+                return
+            self.result.emit(f"✓ Connected to Resolve - Timeline: {timeline.GetName()}")
+            self.timeline_fps.emit(get_timeline_fps(timeline))
+        except Exception as e:
+            self.result.emit(f"⚠️  Resolve connection error: {e}")
+
+
 class AddMetadataGUI(QMainWindow):
     """Main GUI window for shot metadata operations."""
     
+    EXCEL_FILTER = "Excel Files (*.xlsx *.xls)"
+    VIDEO_FILTER = "Video Files (*.mov *.mp4 *.avi *.mxf);;All Files (*.*)"
+    
     def __init__(self):
         super().__init__()
         self.last_output_dir = None
+        self.worker = None
+        self._resolve_probe = None
+        self._close_when_idle = False  # User asked to close while a thread was still running
+        self._last_dir = ""  # Directory of the last file picked in any open dialog
+        self._last_video_filter = ""  # Filter the user last picked a frame counter with
+        self._column_cache = {}  # (path, mtime, size) -> header row
+
+        # Debounce path edits so typing/pasting doesn't reload the workbook per keystroke
+        self._excel_reload_timer = QTimer(self)
+        self._excel_reload_timer.setSingleShot(True)
+        self._excel_reload_timer.setInterval(300)
+        self._excel_reload_timer.timeout.connect(self.load_excel_columns)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -430,6 +833,8 @@ class AddMetadataGUI(QMainWindow):
         self.setMinimumHeight(1200)
         
         self.column_checkboxes = []
+        self.column_meta = {}  # QCheckBox -> (index, name)
+        self.checked_columns = set()  # Checked QCheckBoxes, kept current by toggled
         self.available_columns = []  # List of (index, name) tuples
         self.rec_in_combo = None
         self.rec_out_combo = None
@@ -665,41 +1070,6 @@ class AddMetadataGUI(QMainWindow):
         self.custom_fps_input.textChanged.connect(self.validate_custom_fps)
         fps_row.addWidget(self.custom_fps_input)
         
-        if dvr is None:
-            self.log.append("⚠️  DaVinci Resolve API not available")
-            return
-
-        try:
-            resolve = dvr.scriptapp("Resolve")
-            if not resolve:
-                self.log.append("⚠️  Could not connect to Resolve")
-                return
-
-            project = resolve.GetProjectManager().GetCurrentProject()
-            if not project:
-                self.log.append("⚠️  No project open")
-                return
-
-            timeline = project.GetCurrentTimeline()
-            if not timeline:
-                self.log.append("⚠️  No timeline open")
-                return
-
-            fps = get_timeline_fps(timeline)
-            fps_str = fps_to_str(fps)
-            idx = self.fps_combo.findText(fps_str)
-            if idx >= 0:
-                self.fps_combo.setCurrentIndex(idx)
-            else:
-                self.fps_combo.setCurrentText("Custom...")
-                self.custom_fps_input.setText(str(fps))
-        except Exception as e:
-            self.log.append(f"⚠️  Resolve connection error: {e}")
-
-        # Show custom input if that was the last selection
-        if self.fps_combo.currentText() == "Custom...":
-            self.custom_fps_input.show()
-        
         fps_row.addStretch()
         
         fps_layout.addLayout(fps_row)
@@ -725,6 +1095,12 @@ class AddMetadataGUI(QMainWindow):
         self.log.setReadOnly(True)
         layout.addWidget(self.log)
         
+        # Worker messages are buffered and flushed to the log at ~30 Hz
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(33)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         # Check if Resolve is available
         self.check_resolve_connection()
         
@@ -775,7 +1151,7 @@ class AddMetadataGUI(QMainWindow):
         """Handle Excel file path changes."""
         # Auto-load columns when a valid file is entered
         if os.path.exists(self.sheet_input.text()):
-            self.load_excel_columns()
+            self._excel_reload_timer.start()
     
     def load_excel_columns(self):
         """Load column headers from the Excel file."""
@@ -783,6 +1159,8 @@ class AddMetadataGUI(QMainWindow):
         for cb in self.column_checkboxes:
             cb.deleteLater()
         self.column_checkboxes.clear()
+        self.column_meta.clear()
+        self.checked_columns.clear()
         self.available_columns.clear()
 
         # Reset clip data combos
@@ -797,8 +1175,9 @@ class AddMetadataGUI(QMainWindow):
         self.shot_code_combo.clear()
         self.shot_code_combo.addItem("(None)", None)
 
+        path_kinds = {}
         sheet_path = self.sheet_input.text()
-        if not sheet_path or not os.path.exists(sheet_path):
+        if _path_kind(sheet_path, path_kinds) != "file":
             self.add_column_checkbox(6, "G", "(No file loaded)", enabled=False)
             self.rec_in_combo.blockSignals(False)
             self.rec_out_combo.blockSignals(False)
@@ -806,10 +1185,12 @@ class AddMetadataGUI(QMainWindow):
             return
 
         try:
-            wb = load_workbook(sheet_path, read_only=True)
-            ws = wb.active
-            headers = list(ws.iter_rows(min_row=1, max_row=1, values_only=True))[0]
-            wb.close()
+            st = os.stat(sheet_path)
+            cache_key = (sheet_path, st.st_mtime, st.st_size)
+            headers = self._column_cache.get(cache_key)
+            if headers is None:
+                headers = _read_header_row(sheet_path)
+                self._column_cache[cache_key] = headers
 
             # Populate Record In / Record Out combos with all columns that have a header
             auto_rec_in = None
@@ -817,7 +1198,7 @@ class AddMetadataGUI(QMainWindow):
             for col_idx, header in enumerate(headers):
                 if not header or not str(header).strip():
                     continue
-                col_letter = get_column_letter(col_idx + 1)
+                col_letter = column_letter(col_idx + 1)
                 col_name = str(header).strip()
                 label = f"[{col_letter}] {col_name}"
                 self.rec_in_combo.addItem(label, col_idx)
@@ -837,7 +1218,7 @@ class AddMetadataGUI(QMainWindow):
             for col_idx in range(1, len(headers)):
                 header = headers[col_idx]
                 if header and str(header).strip():
-                    col_letter = get_column_letter(col_idx + 1)
+                    col_letter = column_letter(col_idx + 1)
                     col_name = str(header).strip()
                     self.available_columns.append((col_idx, col_name))
                     self.add_column_checkbox(col_idx, col_letter, col_name, checked=False)
@@ -863,8 +1244,12 @@ class AddMetadataGUI(QMainWindow):
         cb = QCheckBox(f"[{col_letter}] {col_name}")
         cb.setChecked(checked)
         cb.setEnabled(enabled)
-        cb.setProperty("col_idx", col_idx)
-        cb.setProperty("col_name", col_name)
+        self.column_meta[cb] = (col_idx, col_name)
+        if checked:
+            self.checked_columns.add(cb)
+        cb.toggled.connect(
+            lambda on, box=cb: self.checked_columns.add(box) if on else self.checked_columns.discard(box)
+        )
         self.column_checkbox_layout.addWidget(cb)
         self.column_checkboxes.append(cb)
     
@@ -880,65 +1265,68 @@ class AddMetadataGUI(QMainWindow):
             cb.setChecked(False)
     
     def get_selected_columns(self):
-        """Get list of selected (column_index, column_name) tuples."""
-        selected = []
-        for cb in self.column_checkboxes:
-            if cb.isChecked() and cb.isEnabled():
-                col_idx = cb.property("col_idx")
-                col_name = cb.property("col_name")
-                selected.append((col_idx, col_name))
-        return selected
+        """Get list of selected (column_index, column_name) tuples, in column order."""
+        return sorted(self.column_meta[cb] for cb in self.checked_columns if cb.isEnabled())
     
     def check_resolve_connection(self):
-        """Check if DaVinci Resolve API is available."""
-        if dvr is None:
-            self.log.append("⚠️  DaVinci Resolve API not available")
-            self.log.append("    Frame counter feature will not work")
+        """Check if DaVinci Resolve API is available without blocking the window."""
+        self._resolve_probe = ResolveProbeWorker()
+        self._resolve_probe.result.connect(self.log.append, Qt.ConnectionType.QueuedConnection)
+        self._resolve_probe.timeline_fps.connect(self.apply_timeline_fps, Qt.ConnectionType.QueuedConnection)
+        self._resolve_probe.finished.connect(self._close_if_pending, Qt.ConnectionType.QueuedConnection)
+        self._resolve_probe.start()
+    
+    @Slot(float)
+    def apply_timeline_fps(self, fps):
+        """Preselect the frame rate reported by the current Resolve timeline."""
+        idx = self.fps_combo.findText(fps_to_str(fps))
+        if idx >= 0:
+            self.fps_combo.setCurrentIndex(idx)
         else:
-            try:
-                resolve = dvr.scriptapp("Resolve")
-                if resolve:
-                    project = resolve.GetProjectManager().GetCurrentProject()
-                    if project:
-                        timeline = project.GetCurrentTimeline()
-                        if timeline:
-                            self.log.append(f"✓ Connected to Resolve - Timeline: {timeline.GetName()}")
-                        else:
-                            self.log.append("⚠️  Connected to Resolve but no timeline open")
-                    else:
-                        self.log.append("⚠️  Connected to Resolve but no project open")
-                else:
-                    self.log.append("⚠️  Could not connect to Resolve")
-            except Exception as e:
-                self.log.append(f"⚠️  Resolve connection error: {e}")
+            self.fps_combo.setCurrentText("Custom...")
+            self.custom_fps_input.setText(str(fps))
     
+    def _set_widgets_enabled(self, enabled, *widgets):
+        """Enable/disable a group of widgets behind a single repaint."""
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in widgets:
+                widget.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    @Slot(bool)
     def toggle_frame_counter(self, enabled):
         """Enable/disable frame counter inputs."""
-        self.fc_file_input.setEnabled(enabled)
-        self.browse_fc_btn.setEnabled(enabled)
-        self.first_frame.setEnabled(enabled)
-        self.shot_code_combo.setEnabled(enabled)
+        self._set_widgets_enabled(
+            enabled, self.fc_file_input, self.browse_fc_btn,
+            self.first_frame, self.shot_code_combo
+        )
     
+    @Slot(bool)
     def toggle_srt(self, enabled):
         """Enable/disable SRT export inputs."""
-        self.srt_output_dir_input.setEnabled(enabled)
-        self.browse_srt_output_btn.setEnabled(enabled)
+        self._set_widgets_enabled(enabled, self.srt_output_dir_input, self.browse_srt_output_btn)
     
+    @Slot(bool)
     def toggle_fcpxml(self, enabled):
         """Enable/disable FCPXML export inputs."""
-        self.fcpxml_output_dir_input.setEnabled(enabled)
-        self.browse_fcpxml_output_btn.setEnabled(enabled)
+        self._set_widgets_enabled(enabled, self.fcpxml_output_dir_input, self.browse_fcpxml_output_btn)
     
+    @Slot()
     def browse_sheet(self):
         """Browse for Excel file."""
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Excel File",
-            self.sheet_input.text(),
-            "Excel Files (*.xlsx *.xls)"
+            self._last_dir or os.path.dirname(self.sheet_input.text()),
+            self.EXCEL_FILTER,
+            options=QFileDialog.Option.ReadOnly
         )
         if path:
+            self._last_dir = os.path.dirname(path)
             self.sheet_input.setText(path)
     
+    @Slot()
     def browse_srt_output_dir(self):
         """Browse for SRT output directory."""
         directory = QFileDialog.getExistingDirectory(
@@ -948,6 +1336,7 @@ class AddMetadataGUI(QMainWindow):
         if directory:
             self.srt_output_dir_input.setText(directory)
     
+    @Slot()
     def browse_fcpxml_output_dir(self):
         """Browse for FCPXML output directory."""
         directory = QFileDialog.getExistingDirectory(
@@ -957,22 +1346,33 @@ class AddMetadataGUI(QMainWindow):
         if directory:
             self.fcpxml_output_dir_input.setText(directory)
     
+    @Slot()
     def browse_frame_counter(self):
         """Browse for frame counter video file."""
-        path, _ = QFileDialog.getOpenFileName(
+        path, selected_filter = QFileDialog.getOpenFileName(
             self, "Select Frame Counter Video",
-            self.fc_file_input.text(),
-            "Video Files (*.mov *.mp4 *.avi *.mxf);;All Files (*.*)"
+            self._last_dir or os.path.dirname(self.fc_file_input.text()),
+            self.VIDEO_FILTER,
+            selectedFilter=self._last_video_filter,
+            options=QFileDialog.Option.ReadOnly
         )
         if path:
+            self._last_dir = os.path.dirname(path)
+            self._last_video_filter = selected_filter
             self.fc_file_input.setText(path)
     
+    @Slot()
     def start_processing(self):
         """Begin processing metadata and/or frame counters."""
+        path_kinds = {}
         sheet_path = self.sheet_input.text()
-        if not sheet_path or not os.path.exists(sheet_path):
+        if _path_kind(sheet_path, path_kinds) != "file":
             QMessageBox.warning(self, "Error", "Please specify a valid Excel file")
             return
+        ok, err = _probe_sheet(sheet_path)
+        if not ok:
+            QMessageBox.warning(self, "Error", f"Could not read Excel file:\n{err}")
+            return
         
         # Get selected columns
         selected_columns = self.get_selected_columns()
@@ -982,52 +1382,49 @@ class AddMetadataGUI(QMainWindow):
         srt_enabled = self.srt_enable.isChecked()
         fcpxml_enabled = self.fcpxml_enable.isChecked()
         
+        # Collect every remaining problem so the user can fix them in one pass
+        errors = []
+        
         # Validate at least one operation is selected
         if not fc_enabled and not srt_enabled and not fcpxml_enabled:
-            QMessageBox.warning(self, "Error", 
-                              "Please enable at least one operation:\n"
-                              "- Enable SRT export, or\n"
-                              "- Enable FCPXML export, or\n"
-                              "- Enable frame counter addition")
-            return
+            errors.append("Please enable at least one operation: SRT export, "
+                          "FCPXML export, or frame counter addition")
         
         # Validate columns selected if SRT or FCPXML is enabled
         if (srt_enabled or fcpxml_enabled) and len(selected_columns) == 0:
-            QMessageBox.warning(self, "Error", 
-                              "Please select at least one metadata column to export")
-            return
+            errors.append("Please select at least one metadata column to export")
         
         # Validate SRT output directory if enabled
         srt_output_dir = None
         if srt_enabled:
             srt_output_dir = self.srt_output_dir_input.text()
-            if not srt_output_dir or not os.path.exists(srt_output_dir):
-                QMessageBox.warning(self, "Error", "Please specify a valid SRT output directory")
-                return
+            if _path_kind(srt_output_dir, path_kinds) != "dir":
+                errors.append("Please specify a valid SRT output directory")
         
         # Validate FCPXML output directory if enabled
         fcpxml_output_dir = None
         if fcpxml_enabled:
             fcpxml_output_dir = self.fcpxml_output_dir_input.text()
-            if not fcpxml_output_dir or not os.path.exists(fcpxml_output_dir):
-                QMessageBox.warning(self, "Error", "Please specify a valid FCPXML output directory")
-                return
+            if _path_kind(fcpxml_output_dir, path_kinds) != "dir":
+                errors.append("Please specify a valid FCPXML output directory")
         
         # Validate frame counter settings if enabled
         frame_counter_path = None
         first_frame = None
         if fc_enabled:
             frame_counter_path = self.fc_file_input.text()
-            if not frame_counter_path or not os.path.exists(frame_counter_path):
-                QMessageBox.warning(self, "Error", "Please specify a valid frame counter video file")
-                return
+            if _path_kind(frame_counter_path, path_kinds) != "file":
+                errors.append("Please specify a valid frame counter video file")
             
             first_frame = self.first_frame.value()
         
         # Get and validate FPS
         fps = self.get_fps()
         if fps is None:
-            QMessageBox.warning(self, "Error", "Please enter a valid FPS value (must be positive)")
+            errors.append("Please enter a valid FPS value (must be positive)")
+        
+        if errors:
+            QMessageBox.warning(self, "Error", "\n".join(f"• {e}" for e in errors))
             return
 
         rec_in_col_idx = self.rec_in_combo.currentData()
@@ -1050,36 +1447,80 @@ class AddMetadataGUI(QMainWindow):
             frame_counter_path, first_frame,
             shot_code_col_idx=shot_code_col_idx
         )
-        self.worker.progress.connect(self.update_log)
-        self.worker.finished.connect(self.processing_done)
+        self.worker.progress.connect(self.update_log, Qt.ConnectionType.QueuedConnection)
+        self.worker.finished.connect(self.processing_done, Qt.ConnectionType.QueuedConnection)
+        self._log_timer.start()
         self.worker.start()
     
+    @Slot(str)
     def update_log(self, msg):
-        """Update log with new message."""
-        self.log.append(msg)
-        self.log.verticalScrollBar().setValue(
-            self.log.verticalScrollBar().maximum()
-        )
+        """Queue a worker message for the next log flush."""
+        self._log_buf.append(msg)
+    
+    @Slot()
+    def _flush_log(self):
+        """Write buffered messages to the log in one edit and scroll once."""
+        if not self._log_buf:
+            return
+        cursor = self.log.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        separator = "" if self.log.document().isEmpty() else "\n"
+        cursor.insertText(separator + "\n".join(self._log_buf))
+        self._log_buf.clear()
+        self.log.setTextCursor(cursor)
+        self.log.ensureCursorVisible()
     
+    @Slot(bool, str)
     def processing_done(self, success, msg):
         """Handle processing completion."""
+        self._log_timer.stop()
+        self._flush_log()
         self.progress.hide()
         self.update_go_button()
         
-        if success:
+        if self._close_when_idle:
+            # finished is the worker's last emit, so its thread is moments from exiting
+            self.worker.wait(CLOSE_WAIT_MS)
+            self._close_if_pending()
+        elif success:
             QMessageBox.information(self, "Success", msg)
         else:
             QMessageBox.critical(self, "Error", f"Processing failed: {msg}")
+    
+    @Slot()
+    def _close_if_pending(self):
+        if self._close_when_idle:
+            self.close()
+    
+    def closeEvent(self, event):
+        """Keep the window open while background threads run, offering to close after.
+
+        Blocking the GUI thread on them would freeze the app for the rest of an
+        export or a hung Resolve check.
+        """
+        if not any(t is not None and t.isRunning() for t in (self._resolve_probe, self.worker)):
+            super().closeEvent(event)
+            return
+        event.ignore()
+        if self._close_when_idle:
+            return
+        reply = QMessageBox.question(
+            self, "Still Working",
+            "Processing or the Resolve connection check is still running.\n\n"
+            "Close the window when it finishes?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            self._close_when_idle = True
+            self.log.append("Closing once background work finishes...")
 
 
 def main():
     app = QApplication(sys.argv)
     
-    theia_dir = Path("/Library/Application Support/Theia")
-    icon_path = theia_dir / "resources" / "graphics" / "add_metadata_icon.png"
-    if icon_path.exists():
-        icon = QIcon(str(icon_path))
-        app.setWindowIcon(icon)
+    # QIcon reads the file lazily when the icon is first drawn; a missing file
+    # just leaves the default icon, so there is no need to stat it up front
+    app.setWindowIcon(QIcon("/Library/Application Support/Theia/resources/graphics/add_metadata_icon.png"))
     
     window = AddMetadataGUI()
     window.show()
@@ -3,8 +3,14 @@ Theia - Clip Inventory GUI
 Exports DaVinci Resolve timeline clips to Excel with thumbnails
 """
 import sys
+import os
+import re
 import base64
 import time
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from timecode import Timecode
@@ -14,12 +20,14 @@ from PySide6.QtWidgets import (
     QPushButton, QLabel, QLineEdit, QFileDialog,
     QMessageBox, QProgressBar, QTextEdit, QCheckBox, QScrollArea, QComboBox
 )
-from PySide6.QtCore import Qt, QThread, Signal, QUrl
-from PySide6.QtGui import QFont, QDesktopServices, QIcon
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, QUrl
+from PySide6.QtGui import QFont, QDesktopServices, QIcon, QTextCursor
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.drawing.image import Image as XLImage
 from openpyxl.styles import Font
+# Pillow-SIMD installs under the same PIL package and is picked up here if present
 from PIL import Image as PILImage
 
 # Import DaVinci Resolve API
@@ -35,38 +43,139 @@ except ImportError:
         dvr = None
 
 
+# Timeline items whose name contains any of these are treated as transitions
+TRANSITION_NAME_RE = re.compile(r"dissolve|transition|wipe|fade", re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def timecode_base(fps):
+    """Return the integer frame base Timecode uses for fps, or None for drop-frame rates."""
+    tc = Timecode(fps, "00:00:01:00")
+    if tc.drop_frame:
+        return None
+    return tc.frames - 1
+
+
+def frames_to_tc(frames, fps, base):
+    """Format a 1-based frame count like str(Timecode(fps, frames=frames)).
+
+    Non-drop rates are formatted with integer divmod; drop-frame rates
+    (base None) go through Timecode.
+
+    >>> frames_to_tc(86400, 23.976, timecode_base(23.976))
+    '00:59:59:23'
+    >>> frames_to_tc(90001, 25.0, timecode_base(25.0))
+    '01:00:00:00'
+    >>> frames_to_tc(17983, 29.97, timecode_base(29.97))
+    '00:10:00;00'
+    """
+    if base is None:
+        return str(Timecode(fps, frames=frames))
+    total_seconds, ff = divmod(frames - 1, base)
+    total_minutes, ss = divmod(total_seconds, 60)
+    hh, mm = divmod(total_minutes, 60)
+    return f"{hh % 24:02d}:{mm:02d}:{ss:02d}:{ff:02d}"
+
+
+# Waits (seconds) between thumbnail polls after moving the playhead; 80 ms in total
+THUMBNAIL_POLL_DELAYS = (0.005, 0.005, 0.01, 0.02, 0.04)
+
+# Log thumbnail grab/encode progress every this many thumbnails
+THUMBNAIL_LOG_EVERY = 25
+
+
 class IntervalSet:
-    """Helper class for efficient interval operations."""
+    """Helper class for efficient interval operations.
+
+    Holds disjoint intervals sorted by start. Because they never overlap, the
+    ends are sorted too, so the intervals touching a query range are found by
+    bisecting both lists: O(log n + k) per call instead of a full scan.
+    """
     def __init__(self, intervals):
-        self.intervals = sorted(intervals)
+        # Fuse overlapping or touching input ranges so the set starts out disjoint;
+        # subtract() only ever trims, so it can never create touching fragments
+        self.starts = []
+        self.ends = []
+        for s, e in sorted(intervals):
+            if s >= e:
+                continue
+            if self.ends and s <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], e)
+            else:
+                self.starts.append(s)
+                self.ends.append(e)
+    
+    @property
+    def intervals(self):
+        return list(zip(self.starts, self.ends))
+    
+    def _overlapping(self, start, end):
+        """Return the index range [lo, hi) of stored intervals overlapping (start, end)."""
+        lo = bisect_right(self.ends, start)
+        hi = bisect_left(self.starts, end, lo)
+        return lo, hi
     
     def intersect(self, start, end):
         """Return portions of (start, end) that overlap with this set."""
+        # Ranges entirely before the earliest or after the latest uncovered frame
+        # are the common case once upper tracks cover a stretch of the timeline
+        if not self.starts or end <= self.starts[0] or start >= self.ends[-1]:
+            return []
+        lo, hi = self._overlapping(start, end)
         result = []
-        for (s, e) in self.intervals:
-            overlap_start = max(start, s)
-            overlap_end = min(end, e)
+        for i in range(lo, hi):
+            overlap_start = max(start, self.starts[i])
+            overlap_end = min(end, self.ends[i])
             if overlap_start < overlap_end:
                 result.append((overlap_start, overlap_end))
         return result
     
     def subtract(self, start, end):
         """Remove (start, end) from this interval set."""
-        new_intervals = []
-        for (s, e) in self.intervals:
-            if end <= s or start >= e:
-                new_intervals.append((s, e))
-            elif start > s and end < e:
-                new_intervals.append((s, start))
-                new_intervals.append((end, e))
-            elif start > s:
-                new_intervals.append((s, start))
-            elif end < e:
-                new_intervals.append((end, e))
-        self.intervals = new_intervals
+        if start >= end:
+            return
+        lo, hi = self._overlapping(start, end)
+        if lo == hi:
+            return
+        # Only the first and last overlapping intervals can leave a remainder
+        new_starts = []
+        new_ends = []
+        if self.starts[lo] < start:
+            new_starts.append(self.starts[lo])
+            new_ends.append(start)
+        if self.ends[hi - 1] > end:
+            new_starts.append(end)
+            new_ends.append(self.ends[hi - 1])
+        self.starts[lo:hi] = new_starts
+        self.ends[lo:hi] = new_ends
     
     def is_empty(self):
-        return len(self.intervals) == 0
+        return len(self.starts) == 0
+
+
+def encode_thumbnail(thumb):
+    """Decode a Resolve thumbnail, scale it to Excel row height and encode it as JPEG.
+
+    Pure CPU work with no Resolve calls, so it runs on a thread pool while the
+    worker keeps moving the playhead for the next row.
+    """
+    img_bytes = base64.b64decode(thumb['data'])
+    img = PILImage.frombytes('RGB', (thumb['width'], thumb['height']), img_bytes)
+
+    # Resize for Excel
+    aspect = img.width / img.height if img.height else 1.0
+    new_h = 150
+    new_w = max(1, int(new_h * aspect))
+    # Cheap bilinear pass down to twice the target first, so LANCZOS only
+    # runs over a small image when Resolve hands back a full-resolution frame
+    if img.height > 2 * new_h:
+        img.thumbnail((img.width, 2 * new_h), PILImage.Resampling.BILINEAR)
+    img = img.resize((new_w, new_h), PILImage.Resampling.LANCZOS)
+
+    buf = BytesIO()
+    img.save(buf, format='JPEG', quality=82, optimize=False, progressive=False)
+    buf.seek(0)
+    return buf
 
 
 class ExportWorker(QThread):
@@ -74,17 +183,39 @@ class ExportWorker(QThread):
     progress = Signal(str)
     finished = Signal(bool, str, int)
     
+    # Log lines are sent to the GUI in batches of up to this many lines / seconds
+    LOG_BATCH_LINES = 50
+    LOG_BATCH_SECONDS = 0.1
+    
     def __init__(self, output_path, selected_tracks, subtitle_track_num=None,
-                 use_duration_markers=False, vfx_only=False):
+                 use_duration_markers=False, vfx_only=False, verbose=False):
         super().__init__()
         self.output_path = output_path
         self.selected_tracks = selected_tracks  # List of track numbers
         self.subtitle_track_num = subtitle_track_num  # Subtitle track for VFX shot codes, or None
         self.use_duration_markers = use_duration_markers  # Use timeline duration markers instead
         self.vfx_only = vfx_only  # If True, only export rows with a VFX shot code
+        self.verbose = verbose  # If True, log the per-clip occlusion decisions
+        self._pending = []
+        self._last_flush = 0.0
     
     def log(self, msg):
-        self.progress.emit(msg)
+        self._pending.append(msg)
+        if (len(self._pending) >= self.LOG_BATCH_LINES
+                or time.monotonic() - self._last_flush >= self.LOG_BATCH_SECONDS):
+            self.flush_log()
+    
+    def debug(self, msg):
+        """Log a per-clip detail line, only in verbose mode."""
+        if self.verbose:
+            self.log(msg)
+    
+    def flush_log(self):
+        """Send buffered log lines to the GUI as a single progress signal."""
+        if self._pending:
+            self.progress.emit("\n".join(self._pending))
+            self._pending.clear()
+        self._last_flush = time.monotonic()
     
     def get_visible_clips(self, timeline):
         """Get all visible clips considering track layering, but ignore transitions.
@@ -94,47 +225,52 @@ class ExportWorker(QThread):
           - type3: fading from nothing to a clip (extend that clip's start)
         Returns a list of dicts: { 'clip', 'track_num', 'clip_start', 'clip_end', 'visible_ranges' }
         """
-        track_count = timeline.GetTrackCount("video")
-
-        # Determine track range
+        # Only the selected tracks are ever scanned
         if self.selected_tracks:
-            min_track = min(self.selected_tracks)
-            max_track = max(self.selected_tracks)
+            track_nums = sorted(set(self.selected_tracks))
         else:
-            min_track, max_track = 1, track_count
+            track_nums = range(1, timeline.GetTrackCount("video") + 1)
 
         timeline_start = timeline.GetStartFrame()
         timeline_end = timeline.GetEndFrame()
 
         self.log(f"Timeline range: {timeline_start} to {timeline_end}")
 
-        # Helper: detect transition items (best-effort)
-        def is_transition_item(tl_item):
-            try:
-                name = (tl_item.GetName() or "").lower()
-                if any(k in name for k in ("dissolve", "transition", "wipe", "fade")):
-                    return True
-                return False
-            except Exception:
-                return False
+        # Snapshot every selected track once. Each Get* call is a round trip to
+        # Resolve, so both passes below work off these plain tuples instead:
+        # (start, end, name, is_transition, enabled, item)
+        def snapshot_track(track_num):
+            snapshot = []
+            for tl_item in timeline.GetItemListInTrack("video", track_num) or []:
+                # Detect transition items (best-effort)
+                try:
+                    name = tl_item.GetName() or ""
+                except Exception:
+                    name = ""
+                is_transition = TRANSITION_NAME_RE.search(name) is not None
+                enabled = True
+                if not is_transition:
+                    try:
+                        enabled = bool(tl_item.GetClipEnabled())
+                    except Exception:
+                        pass
+                snapshot.append((tl_item.GetStart(), tl_item.GetEnd(), name, is_transition, enabled, tl_item))
+            return snapshot
+
+        tracks = {track_num: snapshot_track(track_num) for track_num in track_nums}
+        top_down = sorted(tracks, reverse=True)
 
         def find_lower_clip(track_num, start, end):
             """Find an enabled, selected clip below track_num that overlaps a range."""
-            for lower_track_num in range(track_num - 1, min_track - 1, -1):
-                if self.selected_tracks and lower_track_num not in self.selected_tracks:
+            for lower_track_num in top_down:
+                if lower_track_num >= track_num:
                     continue
 
-                lower_items = timeline.GetItemListInTrack("video", lower_track_num) or []
-                for lower_item in lower_items:
-                    if is_transition_item(lower_item):
+                for lower_start, lower_end, lower_name, lower_is_transition, lower_enabled, _ in tracks[lower_track_num]:
+                    if lower_is_transition or not lower_enabled:
                         continue
-                    try:
-                        if not lower_item.GetClipEnabled():
-                            continue
-                    except Exception:
-                        pass
-                    if lower_item.GetStart() < end and lower_item.GetEnd() > start:
-                        return lower_track_num, lower_item
+                    if lower_start < end and lower_end > start:
+                        return lower_track_num, lower_name
             return None
 
         # Pre-scan to compute per-clip start adjustments for type-3 (beginning-of-clip) transitions
@@ -144,29 +280,22 @@ class ExportWorker(QThread):
         end_adjustments = {}      # (track, start, end) -> frames to subtract from clip end
         transition_keys = set()   # (track, start, end) keys for transition items
 
-        for track_num in range(1, track_count + 1):
-            # skip tracks not in selection if the user selected tracks
-            if self.selected_tracks and track_num not in self.selected_tracks:
-                continue
-
-            clips = timeline.GetItemListInTrack("video", track_num) or []
+        for track_num, clips in tracks.items():
             # iterate with index so we can inspect neighbours
-            for i, item in enumerate(clips):
-                if not is_transition_item(item):
+            for i, (trans_start, trans_end, _, is_transition, _, _) in enumerate(clips):
+                if not is_transition:
                     continue
 
-                trans_start = item.GetStart()
-                trans_end = item.GetEnd()
                 transition_keys.add((track_num, int(trans_start), int(trans_end)))
                 trans_len = max(0, int(trans_end - trans_start))
                 adj = int(round(0.5 * trans_len))
 
-                prev_item = clips[i - 1] if i - 1 >= 0 else None
-                next_item = clips[i + 1] if i + 1 < len(clips) else None
+                prev_clip = clips[i - 1] if i - 1 >= 0 else None
+                next_clip = clips[i + 1] if i + 1 < len(clips) else None
 
                 # check simple overlaps with prev/next to classify
-                overlaps_prev = prev_item is not None and (prev_item.GetEnd() > trans_start)
-                overlaps_next = next_item is not None and (next_item.GetStart() < trans_end)
+                overlaps_prev = prev_clip is not None and (prev_clip[1] > trans_start)
+                overlaps_next = next_clip is not None and (next_clip[0] < trans_end)
 
                 # Type1: overlaps both -> connecting two clips on same track
                 if overlaps_prev and overlaps_next:
@@ -177,32 +306,31 @@ class ExportWorker(QThread):
                 if overlaps_prev and not overlaps_next:
                     lower_clip = find_lower_clip(track_num, trans_start, trans_end)
                     if lower_clip is not None:
-                        lower_track_num, lower_item = lower_clip
+                        lower_track_num, lower_name = lower_clip
                         self.log(
-                            f"  Transition on track {track_num} connects {prev_item.GetName()} "
-                            f"to lower-track clip {lower_item.GetName()} on track {lower_track_num} "
+                            f"  Transition on track {track_num} connects {prev_clip[2]} "
+                            f"to lower-track clip {lower_name} on track {lower_track_num} "
                             f"({trans_start}-{trans_end}) -> type1 hard cut"
                         )
                         continue
                     self.log(f"  Transition on track {track_num} at end of clip ({trans_start}-{trans_end}) -> type2: {adj} frames")
-                    if prev_item is not None:
-                        prev_key = (track_num, int(prev_item.GetStart()), int(prev_item.GetEnd()))
-                        end_adjustments[prev_key] = adj
+                    prev_key = (track_num, int(prev_clip[0]), int(prev_clip[1]))
+                    end_adjustments[prev_key] = adj
                     continue
 
                 # Type3: overlaps next only -> transition at beginning of clip
-                if overlaps_next and not overlaps_prev and next_item is not None:
+                if overlaps_next and not overlaps_prev:
                     lower_clip = find_lower_clip(track_num, trans_start, trans_end)
                     if lower_clip is not None:
-                        lower_track_num, lower_item = lower_clip
+                        lower_track_num, lower_name = lower_clip
                         self.log(
                             f"  Transition on track {track_num} connects lower-track clip "
-                            f"{lower_item.GetName()} on track {lower_track_num} to {next_item.GetName()} "
+                            f"{lower_name} on track {lower_track_num} to {next_clip[2]} "
                             f"({trans_start}-{trans_end}) -> type1 hard cut"
                         )
                         continue
                     self.log(f"  Transition on track {track_num} at start of next clip ({trans_start}-{trans_end}) -> type3: {adj} frames")
-                    next_key = (track_num, int(next_item.GetStart()), int(next_item.GetEnd()))
+                    next_key = (track_num, int(next_clip[0]), int(next_clip[1]))
                     start_adjustments[next_key] = adj
                     continue
 
@@ -213,36 +341,26 @@ class ExportWorker(QThread):
         visible_regions = IntervalSet([(timeline_start, timeline_end)])
         visible_clips = []
 
-        for track_num in range(max_track, min_track - 1, -1):
-            # Skip if track not selected
-            if self.selected_tracks and track_num not in self.selected_tracks:
-                self.log(f"  Skipping unselected track {track_num}")
-                continue
-
-            clips = timeline.GetItemListInTrack("video", track_num)
+        for track_num in top_down:
+            clips = tracks[track_num]
             if not clips:
                 self.log(f"  Track {track_num}: No clips")
                 continue
 
             self.log(f"  Track {track_num}: Processing {len(clips)} clips")
 
-            for clip in clips:
-                raw_start = clip.GetStart()
-                raw_end = clip.GetEnd()
+            for raw_start, raw_end, clip_name, is_transition, enabled, clip in clips:
                 clip_key = (track_num, int(raw_start), int(raw_end))
 
                 # skip transitions entirely
-                if clip_key in transition_keys or is_transition_item(clip):
-                    self.log(f"    Skipping transition item {clip.GetName()} [{raw_start}-{raw_end}]")
+                if is_transition or clip_key in transition_keys:
+                    self.debug(f"    Skipping transition item {clip_name} [{raw_start}-{raw_end}]")
                     continue
 
                 # skip disabled clips
-                try:
-                    if not clip.GetClipEnabled():
-                        self.log(f"    Skipping disabled clip {clip.GetName()} [{raw_start}-{raw_end}]")
-                        continue
-                except Exception:
-                    pass
+                if not enabled:
+                    self.debug(f"    Skipping disabled clip {clip_name} [{raw_start}-{raw_end}]")
+                    continue
 
                 # Apply start/end adjustments from transitions
                 start_adj = start_adjustments.get(clip_key, 0)
@@ -251,16 +369,17 @@ class ExportWorker(QThread):
                 eff_end = raw_end + end_adj
                 # clamp to ensure valid range
                 if eff_start >= eff_end:
-                    self.log(f"    Clip {clip.GetName()} adjusted range invalid ({eff_start} >= {eff_end}) -> skipping")
+                    self.log(f"    Clip {clip_name} adjusted range invalid ({eff_start} >= {eff_end}) -> skipping")
                     continue
 
                 # Get visible portions of this clip (using adjusted range)
                 clip_visible = visible_regions.intersect(eff_start, eff_end)
 
                 if clip_visible:
-                    self.log(f"    {clip.GetName()} [{raw_start}-{raw_end}] (effective {eff_start}-{eff_end}): VISIBLE {clip_visible}")
+                    self.debug(f"    {clip_name} [{raw_start}-{raw_end}] (effective {eff_start}-{eff_end}): VISIBLE {clip_visible}")
                     visible_clips.append({
                         'clip': clip,
+                        'name': clip_name,
                         'track_num': track_num,
                         'clip_start': eff_start,
                         'clip_end': eff_end,
@@ -272,7 +391,7 @@ class ExportWorker(QThread):
                     # Remove this clip's effective area from visible regions
                     visible_regions.subtract(raw_start + start_adj, raw_end - end_adj)
                 else:
-                    self.log(f"    {clip.GetName()} [{raw_start}-{raw_end}] (effective {eff_start}-{eff_end}): OCCLUDED")
+                    self.debug(f"    {clip_name} [{raw_start}-{raw_end}] (effective {eff_start}-{eff_end}): OCCLUDED")
 
             if visible_regions.is_empty():
                 self.log(f"  All regions occluded, stopping at track {track_num}")
@@ -284,81 +403,86 @@ class ExportWorker(QThread):
         return visible_clips
 
     
-    def get_thumbnail(self, timeline, frame, fps, target_track_num=None):
-        """Get thumbnail at a specific timeline frame.
+    def set_video_tracks_enabled(self, timeline, wanted, track_enabled):
+        """Apply {track: enabled} states, skipping tracks already known to be in that state.
+
+        track_enabled is the caller's cache of each track's current state (None if
+        unknown) and is updated in place, so repeated solos never re-query Resolve.
+        """
+        for t, enabled in wanted.items():
+            if track_enabled.get(t) == enabled:
+                continue
+            try:
+                timeline.SetTrackEnable("video", t, enabled)
+                track_enabled[t] = enabled
+            except Exception:
+                pass
+
+    def solo_video_track(self, timeline, track_num, track_enabled):
+        """Enable only the given video track.
 
         NOTE: Resolve's GetCurrentClipThumbnailImage() is tied to the *current* video item.
         When multiple items overlap at the playhead, Resolve may pick an unexpected item.
-        To make the selection deterministic, we temporarily solo the requested video track.
+        Soloing the track being sampled makes the selection deterministic.
         """
-        track_states = None
+        self.set_video_tracks_enabled(
+            timeline, {t: t == int(track_num) for t in track_enabled}, track_enabled
+        )
+
+    def playhead_at(self, timeline, fps, frames):
+        """Return whether the playhead is on the given 1-based Timecode frame.
+
+        Compared as frame numbers: Timecode always writes 29.97/59.94 with the
+        drop-frame ';' while a non-drop timeline reports ':'.
+        """
+        try:
+            return Timecode(fps, timeline.GetCurrentTimecode()).frames == frames
+        except Exception:
+            return False
+
+    def get_thumbnail(self, timeline, frame, fps):
+        """Get Resolve's raw thumbnail dict at a specific timeline frame."""
         try:
             # Convert timeline frame -> timeline timecode (Timecode lib is 1-based frames)
             tc = Timecode(fps, frames=int(frame + 1))
 
-            # If requested, temporarily solo the target track so the "current video item" is unambiguous
-            if target_track_num is not None:
-                track_count = timeline.GetTrackCount("video")
-                track_states = {}
-                for t in range(1, track_count + 1):
-                    # Cache current enable state
-                    try:
-                        track_states[t] = bool(timeline.GetIsTrackEnabled("video", t))
-                    except Exception:
-                        # If the call fails for some reason, assume enabled and continue
-                        track_states[t] = True
-
-                # Solo the requested track (disable all others)
-                for t in range(1, track_count + 1):
-                    timeline.SetTrackEnable("video", t, (t == int(target_track_num)))
-
             # Move playhead
-            if not timeline.SetCurrentTimecode(str(tc)):
-                return None
-
-            # Give UI a tiny moment to update in Color page (helps on heavy timelines)
-            time.sleep(0.03)
-
-            # Fetch thumbnail for Resolve's current video item
-            thumb = timeline.GetCurrentClipThumbnailImage()
-            if not thumb or not thumb.get('data'):
+            tc_str = str(tc)
+            if not timeline.SetCurrentTimecode(tc_str):
                 return None
 
-            img_bytes = base64.b64decode(thumb['data'])
-            img = PILImage.frombytes('RGB', (thumb['width'], thumb['height']), img_bytes)
-
-            # Resize for Excel
-            aspect = img.width / img.height if img.height else 1.0
-            new_h = 150
-            new_w = max(1, int(new_h * aspect))
-            return img.resize((new_w, new_h), PILImage.Resampling.LANCZOS)
+            # Give the Color page a moment to catch up, polling with backoff rather than
+            # a fixed sleep; take the first thumbnail once the playhead has landed, and
+            # on the last poll take it regardless
+            last_poll = len(THUMBNAIL_POLL_DELAYS) - 1
+            for poll, delay in enumerate(THUMBNAIL_POLL_DELAYS):
+                time.sleep(delay)
+                if poll < last_poll and not self.playhead_at(timeline, fps, tc.frames):
+                    continue
+                # Fetch thumbnail for Resolve's current video item
+                thumb = timeline.GetCurrentClipThumbnailImage()
+                if thumb and thumb.get('data'):
+                    return thumb
+            return None
 
         except Exception as e:
             self.log(f"    Thumbnail error: {e}")
             return None
 
-        finally:
-            # Restore original track enable states
-            if track_states:
-                for t, enabled in track_states.items():
-                    try:
-                        timeline.SetTrackEnable("video", t, enabled)
-                    except Exception:
-                        pass
-
-
-
     def run(self):
         """Main export logic."""
+        thumb_pool = None
         try:
             self.log("Connecting to DaVinci Resolve...")
             
             if dvr is None:
+                self.flush_log()
                 self.finished.emit(False, "DaVinci Resolve API not available. Make sure Resolve is running.", 0)
                 return
             
             resolve = dvr.scriptapp("Resolve")
             if not resolve:
+                self.flush_log()
                 self.finished.emit(False, "Could not connect to Resolve. Make sure DaVinci Resolve is running.", 0)
                 return
             
@@ -366,6 +490,7 @@ class ExportWorker(QThread):
             timeline = project.GetCurrentTimeline() if project else None
             
             if not timeline:
+                self.flush_log()
                 self.finished.emit(False, "No timeline open", 0)
                 return
             
@@ -385,6 +510,7 @@ class ExportWorker(QThread):
             
             # Switch to Color page for thumbnails
             self.log("Opening Color page...")
+            self.flush_log()
             resolve.OpenPage('color')
             time.sleep(0.5)
             
@@ -439,6 +565,7 @@ class ExportWorker(QThread):
                             pass
                 resolve.OpenPage(starting_page)
                 timeline.SetCurrentTimecode(starting_timecode)
+                self.flush_log()
                 self.finished.emit(False, f"No visible clips found on selected tracks", 0)
                 return
             
@@ -446,7 +573,7 @@ class ExportWorker(QThread):
             
             # Flatten visible clips into individual visible ranges and sort by start time
             all_visible_ranges = []
-            for clip_info in visible_clips:
+            for clip_id, clip_info in enumerate(visible_clips):
                 clip = clip_info['clip']
                 track_num = clip_info['track_num']
                 visible_ranges = clip_info['visible_ranges']
@@ -454,6 +581,8 @@ class ExportWorker(QThread):
                 for vis_start, vis_end in visible_ranges:
                     all_visible_ranges.append({
                         'clip': clip,
+                        'clip_id': clip_id,
+                        'name': clip_info['name'],
                         'track_num': track_num,
                         'vis_start': vis_start,
                         'vis_end': vis_end,
@@ -467,10 +596,9 @@ class ExportWorker(QThread):
             
             self.log(f"Expanded to {len(all_visible_ranges)} visible range(s)\n")
             
-            # Create Excel workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Shots"
+            # Create Excel workbook; write-only mode streams each row to disk as it's appended
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Shots")
             
             # Headers
             headers = ["Thumbnail", "Reel Name", "Cut Order", "Record In",
@@ -478,12 +606,8 @@ class ExportWorker(QThread):
             if vfx_source_active:
                 headers.append("VFX Shot Code")
             headers.append("Metadata")
-            for idx, header in enumerate(headers, 1):
-                cell = ws.cell(1, idx, header)
-                if header in ("Record In", "Record Out"):
-                    cell.font = Font(bold=True)
 
-            # Column widths
+            # Column widths (must be set before the first row is appended)
             ws.column_dimensions['A'].width = 34
             ws.column_dimensions['B'].width = 25
             for col in ['C', 'D', 'E', 'F', 'G']:
@@ -493,28 +617,31 @@ class ExportWorker(QThread):
             if len(headers) >= 9:
                 ws.column_dimensions['I'].width = 15
             
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, header)
+                if header in ("Record In", "Record Out"):
+                    cell.font = Font(bold=True)
+                header_row.append(cell)
+            ws.append(header_row)
+            
             # Process clips - one row per visible range
             row_num = 2  # Start after header
             
             # Track which clips have multiple visible ranges for naming
-            clip_range_counts = {}
-            clip_range_indices = {}
-            
-            for range_info in all_visible_ranges:
-                clip = range_info['clip']
-                clip_id = id(clip)  # Use object id as unique identifier
-                
-                if clip_id not in clip_range_counts:
-                    # Count how many ranges this clip has
-                    clip_range_counts[clip_id] = sum(1 for r in all_visible_ranges if id(r['clip']) == clip_id)
-                    clip_range_indices[clip_id] = 0
-                
-                clip_range_indices[clip_id] += 1
-            
-            # Reset indices for actual processing
+            clip_range_counts = Counter(r['clip_id'] for r in all_visible_ranges)
             clip_range_indices = {}
             processed_clip_count = 0
             
+            self.log(f"Encoding thumbnails with Pillow {PILImage.__version__}")
+            thumb_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+            thumb_jobs = []  # (row_num, future of the encoded JPEG)
+            rows = []  # (row_num, cell values) in export order
+            thumb_requests = []  # (track_num, timeline frame, row_num)
+            clip_src_info = {}  # clip_id -> (has media item, (src_fps, src_start + left offset) or None)
+            media_props_cache = {}  # media pool item unique id -> (src_fps, src_start frames)
+            tc_base = timecode_base(fps)
+            
             for cut_order, range_info in enumerate(all_visible_ranges, 1):
                 clip = range_info['clip']
                 track_num = range_info['track_num']
@@ -522,14 +649,14 @@ class ExportWorker(QThread):
                 vis_end = range_info['vis_end']
                 clip_start_record = range_info['clip_start_record']
                 raw_start = range_info['raw_start']
-                clip_id = id(clip)
+                clip_id = range_info['clip_id']
                 
                 # Track which part this is
                 if clip_id not in clip_range_indices:
                     clip_range_indices[clip_id] = 0
                 clip_range_indices[clip_id] += 1
                 
-                self.log(f"[{cut_order}] Track {track_num}: {clip.GetName()} [{vis_start}-{vis_end}]")
+                self.log(f"[{cut_order}] Track {track_num}: {range_info['name']} [{vis_start}-{vis_end}]")
 
                 # VFX Shot Code - look up before writing any cells so we can skip early
                 shot_code = None
@@ -551,68 +678,112 @@ class ExportWorker(QThread):
                         continue
 
                 # Reel Name
-                clip_name = clip.GetName()
+                clip_name = range_info['name']
                 if clip_range_counts[clip_id] > 1:
                     clip_name = f"{clip_name} (part {clip_range_indices[clip_id]})"
-                ws.cell(row_num, 2, clip_name)
-
-                # Cut Order
-                ws.cell(row_num, 3, cut_order)
 
                 # Timecodes - use visible range
-                tc_in = Timecode(fps, frames=int(vis_start + 1))
-                tc_out = Timecode(fps, frames=int(vis_end + 1))
-                ws.cell(row_num, 4, str(tc_in))
-                ws.cell(row_num, 5, str(tc_out))
-
-                # Duration (Record Out - Record In + 1)
-                ws.cell(row_num, 6, int(vis_end - vis_start))
+                tc_in = frames_to_tc(int(vis_start + 1), fps, tc_base)
+                tc_out = frames_to_tc(int(vis_end + 1), fps, tc_base)
+
+                # Source start is the same for every range of a clip, so look it up once
+                if clip_id not in clip_src_info:
+                    src_info = None
+                    media_item = clip.GetMediaPoolItem()
+                    if media_item:
+                        try:
+                            # Clips cut from the same source share its properties
+                            media_id = media_item.GetUniqueId()
+                            if media_id not in media_props_cache:
+                                props = media_item.GetClipProperty()
+                                src_fps = float(props.get('FPS', fps))
+                                src_start = Timecode(str(src_fps), props.get('Start TC')).frames
+                                media_props_cache[media_id] = (src_fps, src_start)
+                            src_fps, src_start = media_props_cache[media_id]
+                            src_info = (src_fps, src_start + clip.GetLeftOffset())
+                        except:
+                            pass
+                    clip_src_info[clip_id] = (bool(media_item), src_info)
+                has_media, src_info = clip_src_info[clip_id]
 
-                # Source timecode
-                media_item = clip.GetMediaPoolItem()
-                if media_item:
+                # Source timecode (defaults to record in)
+                source_in = tc_in
+                if src_info:
                     try:
-                        props = media_item.GetClipProperty()
-                        src_fps = float(props.get('FPS', fps))
-                        src_tc_str = props.get('Start TC')
-                        src_start = Timecode(str(src_fps), src_tc_str).frames
-
                         # Calculate source TC, accounting for transition handle at in
-                        start_adj = range_info['start_adj']
-                        offset_into_clip = vis_start - clip_start_record - start_adj
-                        src_tc = Timecode(src_fps, frames=int(src_start + clip.GetLeftOffset() + offset_into_clip))
-                        ws.cell(row_num, 7, str(src_tc))
+                        src_fps, src_origin = src_info
+                        offset_into_clip = vis_start - clip_start_record - range_info['start_adj']
+                        source_in = frames_to_tc(int(src_origin + offset_into_clip), src_fps, timecode_base(src_fps))
                     except:
-                        ws.cell(row_num, 7, str(tc_in))
-                else:
-                    ws.cell(row_num, 7, str(tc_in))
-
-                if shot_code is not None:
-                    ws.cell(row_num, 8, shot_code)
-                    metadata_col = 9
-                else:
-                    metadata_col = 8
+                        pass
 
                 # Thumbnail - grab past the transition so Color UI lands on the right clip
-                if media_item:
-                    thumb_frame = int((vis_start + vis_end) / 2)
-                    thumb = self.get_thumbnail(timeline, thumb_frame, fps, target_track_num=track_num)
-                    if thumb:
-                        buf = BytesIO()
-                        thumb.save(buf, format='PNG')
-                        buf.seek(0)
-                        ws.add_image(XLImage(buf), f'A{row_num}')
-                        ws.row_dimensions[row_num].height = 112.5
-                    else:
-                        ws.cell(row_num, 1, "No thumbnail")
-                else:
-                    ws.cell(row_num, 1, "No thumbnail")
+                if has_media:
+                    thumb_requests.append((track_num, int((vis_start + vis_end) / 2), row_num))
+
+                # Duration (Record Out - Record In + 1)
+                row = [None, clip_name, cut_order,
+                       tc_in, tc_out, int(vis_end - vis_start), source_in]
+                if shot_code is not None:
+                    row.append(shot_code)
+                rows.append((row_num, row))
 
                 row_num += 1
                 processed_clip_count += 1
             
+            # Grab thumbnails one track at a time so each track is soloed once rather
+            # than per thumbnail. Only the grab talks to Resolve; decoding and encoding
+            # run on the pool.
+            self.log(f"\nGrabbing {len(thumb_requests)} thumbnails...")
+            self.flush_log()
+            thumb_requests.sort()
+            soloed_track = None
+            # Current enable state per video track, seeded from the snapshot taken at start
+            track_enabled = {
+                t: starting_video_track_states.get(t)
+                for t in range(1, timeline.GetTrackCount("video") + 1)
+            }
+            for grabbed, (track_num, thumb_frame, thumb_row) in enumerate(thumb_requests, 1):
+                if track_num != soloed_track:
+                    self.solo_video_track(timeline, track_num, track_enabled)
+                    soloed_track = track_num
+                thumb = self.get_thumbnail(timeline, thumb_frame, fps)
+                if thumb:
+                    thumb_jobs.append((thumb_row, thumb_pool.submit(encode_thumbnail, thumb)))
+                if grabbed % THUMBNAIL_LOG_EVERY == 0 or grabbed == len(thumb_requests):
+                    self.log(f"  Grabbed {grabbed}/{len(thumb_requests)} thumbnails")
+            if soloed_track is not None:
+                self.set_video_tracks_enabled(
+                    timeline,
+                    {t: starting_video_track_states.get(t, True) for t in track_enabled},
+                    track_enabled
+                )
+            thumb_jobs.sort(key=lambda job: job[0])
+            
+            # Collect the encodes before writing rows, so a thumbnail that fails to
+            # encode still gets the 'No thumbnail' placeholder
+            thumb_images = {}  # row_num -> XLImage, in row order
+            for encoded, (thumb_row, future) in enumerate(thumb_jobs, 1):
+                try:
+                    thumb_images[thumb_row] = XLImage(future.result())
+                except Exception as e:
+                    self.log(f"    Thumbnail error (row {thumb_row}): {e}")
+                if encoded % THUMBNAIL_LOG_EVERY == 0 or encoded == len(thumb_jobs):
+                    self.log(f"  Encoded {encoded}/{len(thumb_jobs)} thumbnails")
+            
+            # Row heights are written with the row, so size them before appending
+            for out_row, row in rows:
+                if out_row in thumb_images:
+                    ws.row_dimensions[out_row].height = 112.5
+                else:
+                    row[0] = "No thumbnail"
+                ws.append(row)
+            for thumb_row, image in thumb_images.items():
+                ws.add_image(image, f'A{thumb_row}')
+            
             # Save
             self.log(f"\nSaving to {self.output_path}...")
+            self.flush_log()
             wb.save(self.output_path)
             
             # Restore video track enable states
@@ -628,6 +799,7 @@ class ExportWorker(QThread):
             timeline.SetCurrentTimecode(starting_timecode)
             resolve.OpenPage(starting_page)
             
+            self.flush_log()
             self.finished.emit(True, f"Successfully exported {processed_clip_count} clips", processed_clip_count)
             
         except Exception as e:
@@ -649,7 +821,12 @@ class ExportWorker(QThread):
             except Exception:
                 pass
 
+            self.flush_log()
             self.finished.emit(False, str(e), 0)
+        finally:
+            # Also covers the early returns; queued encodes are dropped, not waited on
+            if thumb_pool is not None:
+                thumb_pool.shutdown(cancel_futures=True)
 
 
 class ClipInventoryGUI(QMainWindow):
@@ -788,10 +965,22 @@ class ClipInventoryGUI(QMainWindow):
         layout.addWidget(self.progress)
         
         # Log
-        layout.addWidget(QLabel("Log:"))
+        log_row = QHBoxLayout()
+        log_row.addWidget(QLabel("Log:"))
+        log_row.addStretch()
+        # Per-clip VISIBLE/OCCLUDED/skipped decisions, for tracking down wrong inventories
+        self.verbose_checkbox = QCheckBox("Verbose log")
+        log_row.addWidget(self.verbose_checkbox)
+        layout.addLayout(log_row)
         self.log = QTextEdit()
         self.log.setReadOnly(True)
         layout.addWidget(self.log)
+        
+        # Worker messages are buffered and flushed to the log at ~30 Hz
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(33)
+        self._log_timer.timeout.connect(self._flush_log)
     
     def populate_track_list(self):
         """Get available video tracks from current timeline."""
@@ -956,6 +1145,7 @@ class ClipInventoryGUI(QMainWindow):
                 use_duration_markers = True
 
         self.log.clear()
+        self._log_buf.clear()
         self.export_btn.setEnabled(False)
         self.progress.setRange(0, 0)
         self.progress.show()
@@ -965,19 +1155,33 @@ class ClipInventoryGUI(QMainWindow):
 
         vfx_only = self.vfx_enable.isChecked() and self.vfx_only_checkbox.isChecked()
         self.worker = ExportWorker(output, selected_tracks, subtitle_track_num,
-                                   use_duration_markers, vfx_only)
+                                   use_duration_markers, vfx_only,
+                                   verbose=self.verbose_checkbox.isChecked())
         self.worker.progress.connect(self.update_log)
         self.worker.finished.connect(self.export_done)
+        self._log_timer.start()
         self.worker.start()
     
     def update_log(self, msg):
-        self.log.append(msg)
-        self.log.verticalScrollBar().setValue(
-            self.log.verticalScrollBar().maximum()
-        )
+        """Queue a worker message for the next log flush."""
+        self._log_buf.append(msg)
+    
+    def _flush_log(self):
+        """Write buffered messages to the log in one edit and scroll once."""
+        if not self._log_buf:
+            return
+        cursor = self.log.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        separator = "" if self.log.document().isEmpty() else "\n"
+        cursor.insertText(separator + "\n".join(self._log_buf))
+        self._log_buf.clear()
+        self.log.setTextCursor(cursor)
+        self.log.ensureCursorVisible()
     
     def export_done(self, success, msg, clip_count):
         """Handle export completion."""
+        self._log_timer.stop()
+        self._flush_log()
         self.export_btn.setEnabled(True)
         self.progress.hide()
         
@@ -13,14 +13,118 @@ from PySide6.QtWidgets import (
     QPushButton, QLabel, QLineEdit, QComboBox, QFileDialog,
     QMessageBox, QProgressBar, QTextEdit, QGroupBox, QSpinBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
+from PySide6.QtGui import QFont, QIcon, QTextCursor
 
-from PIL import Image, ImageDraw, ImageFont
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from fractions import Fraction
+from functools import lru_cache
 import subprocess
 import tempfile
 
+# Ranges longer than this are rendered across worker processes
+PARALLEL_FRAME_THRESHOLD = 500
+# Frames bigger than this (raw RGB bytes) always render in process: stamping them
+# costs less than pickling them back from a worker
+PARALLEL_MAX_FRAME_BYTES = 1 << 20
+# Frames rendered per worker task; keeps results small enough to queue a few per process
+RENDER_BATCH_FRAMES = 16
+# Upper bound on rendered bytes queued in worker results ahead of ffmpeg
+RENDER_PENDING_BYTES = 64 << 20
+# Write buffer for ffmpeg's stdin
+PIPE_BUFFER_BYTES = 1 << 20
+# H.264 encoders in order of preference: Apple and NVIDIA hardware, then software
+H264_ENCODERS = ('h264_videotoolbox', 'h264_nvenc', 'libx264')
+
+
+@lru_cache(maxsize=4)
+def available_h264_encoders(ffmpeg_bin):
+    """Return the H264_ENCODERS this ffmpeg build lists, asking it only once.
+
+    Falls back to the full list if ffmpeg can't be queried, leaving it to the
+    encode attempts to find one that works.
+    """
+    try:
+        result = subprocess.run([ffmpeg_bin, '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return H264_ENCODERS
+    listed = {line.split()[1] for line in result.stdout.splitlines() if len(line.split()) > 1}
+    found = tuple(codec for codec in H264_ENCODERS if codec in listed)
+    return found or H264_ENCODERS
+
+
+@lru_cache(maxsize=16)
+def load_font(font_path, size):
+    """Load a TrueType font, or PIL's default font when font_path is None."""
+    from PIL import ImageFont
+    if font_path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(font_path, size)
+
+
+def build_glyph_tiles(font, chars="-0123456789"):
+    """Rasterize each character once into an L mask cropped to its ink.
+
+    Returns {char: (mask, dx, dy, advance)}, where (dx, dy) is the mask's offset
+    from the pen position.
+    """
+    from PIL import Image, ImageDraw
+    tiles = {}
+    for ch in chars:
+        left, top, right, bottom = font.getbbox(ch)
+        advance = font.getlength(ch)
+        mask = Image.new("L", (max(1, int(right), int(advance + 0.5)), max(1, int(bottom))))
+        ImageDraw.Draw(mask).text((0, 0), ch, font=font, fill=255)
+        ink = mask.getbbox() or (0, 0, 1, 1)
+        tiles[ch] = (mask.crop(ink), ink[0], ink[1], advance)
+    return tiles
+
+
+@lru_cache(maxsize=16)
+def load_glyph_tiles(font_path, size):
+    """Glyph tiles for a font at a given size, kept across runs in this process."""
+    return build_glyph_tiles(load_font(font_path, size))
+
+
+def render_frame(im, text_xy, tiles, text_color, dirty, frame):
+    """Stamp the frame number from cached glyph tiles and return raw RGB bytes.
+
+    The canvas stays black apart from the glyphs, so only the boxes the previous
+    frame painted (tracked in dirty) are cleared instead of the whole image.
+    """
+    for box in dirty:
+        im.paste((0, 0, 0), box)
+    dirty.clear()
+    x0, y0 = text_xy
+    cursor = 0.0
+    for ch in str(frame):
+        mask, dx, dy, advance = tiles[ch]
+        left = x0 + round(cursor) + dx
+        top = y0 + dy
+        im.paste(text_color, (left, top), mask)
+        dirty.append((left, top, left + mask.width, top + mask.height))
+        cursor += advance
+    return im.tobytes()
+
+
+# Render state for pool processes, set once per process by the initializer
+_pool_render = None
+
+
+def _init_render_process(w, h, font_path, font_size, text_color):
+    global _pool_render
+    from PIL import Image
+    im = Image.new(mode="RGB", size=(w, h))
+    _pool_render = (im, (int(0.1 * h), int(0.1 * h)),
+                    load_glyph_tiles(font_path, font_size), text_color, [])
+
+
+def _render_batch_process(first, stop):
+    return [render_frame(*_pool_render, f) for f in range(first, stop)]
+
 
 class FrameCounterWorker(QThread):
     """Threaded worker for frame counter generation."""
@@ -43,6 +147,9 @@ class FrameCounterWorker(QThread):
 
     def run(self):
         try:
+            # PIL is only needed once generation starts; keep it off the GUI's startup path
+            from PIL import Image
+
             fps = self.fps
             w = self.width
             h = self.height
@@ -52,37 +159,66 @@ class FrameCounterWorker(QThread):
             # FPS label for filenames: 23.976 -> 23_976, 24.0 -> 24
             fps_label = f"{fps:g}".replace('.', '_')
 
-            # Temp directory for frame images
-            temp_frames_dir = tempfile.mkdtemp(prefix="fc_frames_")
-
             self.log(f"Settings: {w}x{h}, frames {begin}–{end}, {fps} fps")
             self.log(f"Font: {self.font_path}")
             self.log(f"Output: {self.output_dir}")
             self.log("=" * 50)
 
-            # Load font
+            # Load font (cached, so repeat runs at the same size skip the disk read)
+            font_path = self.font_path
+            font_size = int(0.75 * h)
             try:
-                font = ImageFont.truetype(self.font_path, int(0.75 * h))
+                load_font(font_path, font_size)
             except Exception as e:
-                self.log(f"WARNING: Could not load font '{self.font_path}': {e}")
+                self.log(f"WARNING: Could not load font '{font_path}': {e}")
                 self.log("Falling back to default font")
-                font = ImageFont.load_default()
+                font_path = None
 
-            # Zero-pad filenames to enough digits for correct alphabetical sort
-            max_digits = max(4, len(str(end)))
-
-            # Generate frame images
+            # Frames are stamped from pre-rasterized digit tiles onto a reused canvas
+            # and piped to ffmpeg as raw RGB
             total_frames = end - begin + 1
-            self.log(f"Generating {total_frames} frame images...")
-            for i, f in enumerate(range(begin, end + 1)):
-                im = Image.new(mode="RGB", size=(w, h))
-                draw = ImageDraw.Draw(im)
-                draw.text((int(0.1 * h), int(0.1 * h)), str(f), font=font, fill=self.text_color)
-                file_name = str(f).zfill(max_digits) + '.png'
-                im.save(os.path.join(temp_frames_dir, file_name))
-
-                if (i + 1) % 100 == 0 or i == total_frames - 1:
-                    self.log(f"  Frames: {i + 1}/{total_frames}")
+            im = Image.new(mode="RGB", size=(w, h))
+            dirty = []
+            text_xy = (int(0.1 * h), int(0.1 * h))
+            tiles = load_glyph_tiles(font_path, font_size)
+
+            def render_serial(first):
+                for f in range(first, end + 1):
+                    yield render_frame(im, text_xy, tiles, self.text_color, dirty, f)
+
+            def render_parallel():
+                # Batches in flight are capped by RENDER_PENDING_BYTES so rendered frames
+                # waiting on ffmpeg stay bounded; results come back in frame order.
+                next_frame = begin
+                workers = os.cpu_count() or 1
+                max_pending = max(1, min(workers * 2,
+                                         RENDER_PENDING_BYTES // (w * h * 3 * RENDER_BATCH_FRAMES)))
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_render_process,
+                        initargs=(w, h, font_path, font_size, self.text_color),
+                    ) as pool:
+                        pending = deque()
+                        for first in range(begin, end + 1, RENDER_BATCH_FRAMES):
+                            stop = min(first + RENDER_BATCH_FRAMES, end + 1)
+                            pending.append(pool.submit(_render_batch_process, first, stop))
+                            if len(pending) >= max_pending:
+                                batch = pending.popleft().result()
+                                next_frame += len(batch)
+                                yield from batch
+                        while pending:
+                            batch = pending.popleft().result()
+                            next_frame += len(batch)
+                            yield from batch
+                except (OSError, BrokenProcessPool) as e:
+                    self.log(f"  Parallel rendering unavailable ({e}), continuing in one process")
+                    yield from render_serial(next_frame)
+
+            def render_frames():
+                if total_frames > PARALLEL_FRAME_THRESHOLD and w * h * 3 <= PARALLEL_MAX_FRAME_BYTES:
+                    return render_parallel()
+                return render_serial(begin)
 
             # Calculate starting timecode
             import timecode as tc_mod
@@ -90,69 +226,56 @@ class FrameCounterWorker(QThread):
             start_timecode = str(tc)
             self.log(f"Setting start timecode to: {start_timecode}")
 
-            # Step 1: encode image sequence to temp video
-            self.log("Creating video from frames...")
             ffmpeg_bin = shutil.which('ffmpeg') or '/opt/homebrew/bin/ffmpeg'
             fps_frac = Fraction(fps).limit_denominator(1001)
-
-            temp_video_path = os.path.join(self.output_dir, f"temp_{fps_label}fps.mp4")
             fps_str = f'{fps_frac.numerator}/{fps_frac.denominator}'
-            img_pattern = os.path.join(temp_frames_dir, f'%0{max_digits}d.png')
+            video_path = os.path.join(self.output_dir, f"frame_counter_{fps_label}fps.mov")
+            # Encode to a temp name so a failed run never clobbers an earlier good output
+            temp_video_path = os.path.join(self.output_dir, f"temp_{fps_label}fps.mov")
 
-            # Try h264_videotoolbox first (macOS built-in, no external lib), fall back to libx264
+            # Try hardware encoders this ffmpeg was built with first (videotoolbox on macOS,
+            # NVENC on NVIDIA hosts), fall back to libx264.
+            # Timecode is stamped in the same pass, so no intermediate file is needed.
             encoded = False
-            for codec in ['h264_videotoolbox', 'libx264']:
+            for codec in available_h264_encoders(ffmpeg_bin):
                 encode_cmd = [
                     ffmpeg_bin,
                     '-loglevel', 'error',
+                    '-f', 'rawvideo',
+                    '-pix_fmt', 'rgb24',
+                    '-s', f'{w}x{h}',
                     '-framerate', fps_str,
-                    '-start_number', str(begin),
-                    '-i', img_pattern,
+                    '-i', 'pipe:0',
                     '-c:v', codec,
+                ]
+                if codec == 'libx264':
+                    # Text on flat black: skip motion search entirely and keep every frame
+                    # an I-frame so the counter scrubs cleanly in the edit
+                    encode_cmd += ['-preset', 'ultrafast', '-tune', 'stillimage', '-g', '1']
+                encode_cmd += [
                     '-pix_fmt', 'yuv420p',
+                    '-timecode', start_timecode,
                     '-y',
                     temp_video_path
                 ]
-                result = subprocess.run(encode_cmd, capture_output=True)
-                if result.returncode == 0:
+                self.log(f"Encoding {total_frames} frames with {codec}...")
+                returncode, stderr = self.pipe_frames(encode_cmd, render_frames(), total_frames)
+                if returncode == 0:
                     encoded = True
                     break
-                self.log(f"  codec {codec} failed (exit {result.returncode}), trying next...")
+                self.log(f"  codec {codec} failed (exit {returncode}), trying next...")
 
             if not encoded:
-                self.log(f"ERROR: all codecs failed. Last stderr: {result.stderr.decode()}")
+                self.log(f"ERROR: all codecs failed. Last stderr: {stderr}")
                 raise RuntimeError("ffmpeg encode failed with all available codecs")
+            os.replace(temp_video_path, video_path)
 
-            # Cleanup temp frames now that video is encoded
-            shutil.rmtree(temp_frames_dir, ignore_errors=True)
-
-            # Step 2: add timecode track via stream copy
-            video_path = os.path.join(self.output_dir, f"frame_counter_{fps_label}fps.mov")
-            tc_cmd = [
-                ffmpeg_bin,
-                '-loglevel', 'error',
-                '-i', temp_video_path,
-                '-c', 'copy',
-                '-timecode', start_timecode,
-                '-y',
-                video_path
-            ]
-            try:
-                subprocess.run(tc_cmd, check=True, capture_output=True)
-                self.log("✓ Timecode metadata applied")
-                os.remove(temp_video_path)
-            except subprocess.CalledProcessError as e:
-                self.log(f"WARNING: ffmpeg timecode failed: {e.stderr.decode()}")
-                self.log("  Saving video without timecode metadata")
-                os.rename(temp_video_path, video_path)
-
+            self.log("✓ Timecode metadata applied")
             self.log("=" * 50)
             self.log(f"✓ Done: {video_path}")
             self.finished.emit(True, f"Generated: {video_path}")
 
         except Exception as e:
-            if 'temp_frames_dir' in locals():
-                shutil.rmtree(temp_frames_dir, ignore_errors=True)
             if 'temp_video_path' in locals() and os.path.exists(temp_video_path):
                 os.remove(temp_video_path)
             self.log(f"ERROR: {e}")
@@ -160,6 +283,33 @@ class FrameCounterWorker(QThread):
             self.log(traceback.format_exc())
             self.finished.emit(False, str(e))
 
+    def pipe_frames(self, cmd, frames, total_frames):
+        """Write raw frames to ffmpeg's stdin. Returns (returncode, stderr text)."""
+        with tempfile.TemporaryFile() as err:
+            # A 1 MiB stdin buffer coalesces small frames into few large pipe writes;
+            # frames bigger than the buffer go straight through without a copy
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=PIPE_BUFFER_BYTES,
+                                    stdout=subprocess.DEVNULL, stderr=err)
+            try:
+                for i, frame in enumerate(frames):
+                    proc.stdin.write(frame)
+                    if (i + 1) % 100 == 0 or i == total_frames - 1:
+                        self.log(f"  Frames: {i + 1}/{total_frames}")
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its return code and stderr say why
+            except BaseException:
+                proc.kill()
+                proc.wait()
+                raise
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            returncode = proc.wait()
+            err.seek(0)
+            return returncode, err.read().decode(errors='replace')
+
 
 class FrameCounterGUI(QMainWindow):
     """Main GUI window for Frame Counter Generator."""
@@ -330,6 +480,12 @@ class FrameCounterGUI(QMainWindow):
         self.log.setReadOnly(True)
         layout.addWidget(self.log)
 
+        # Worker messages are buffered and flushed to the log at ~30 Hz
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(33)
+        self._log_timer.timeout.connect(self._flush_log)
+
     # ── Live helpers ────────────────────────────────────
     def update_frame_count(self):
         count = self.end_spin.value() - self.begin_spin.value() + 1
@@ -413,6 +569,7 @@ class FrameCounterGUI(QMainWindow):
 
         # Launch worker
         self.log.clear()
+        self._log_buf.clear()
         self.go_btn.setEnabled(False)
         self.progress.setRange(0, 0)
         self.progress.show()
@@ -432,14 +589,29 @@ class FrameCounterGUI(QMainWindow):
         )
         self.worker.progress.connect(self.update_log)
         self.worker.finished.connect(self.generation_done)
+        self._log_timer.start()
         self.worker.start()
 
     # ── Callbacks ───────────────────────────────────────
     def update_log(self, msg):
-        self.log.append(msg)
-        self.log.verticalScrollBar().setValue(self.log.verticalScrollBar().maximum())
+        """Queue a worker message for the next log flush."""
+        self._log_buf.append(msg)
+
+    def _flush_log(self):
+        """Write buffered messages to the log in one edit and scroll once."""
+        if not self._log_buf:
+            return
+        cursor = self.log.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        separator = "" if self.log.document().isEmpty() else "\n"
+        cursor.insertText(separator + "\n".join(self._log_buf))
+        self._log_buf.clear()
+        self.log.setTextCursor(cursor)
+        self.log.ensureCursorVisible()
 
     def generation_done(self, success, msg):
+        self._log_timer.stop()
+        self._flush_log()
         self.go_btn.setEnabled(True)
         self.progress.hide()
         if success:
@@ -8,7 +8,9 @@ import re
 import sys
 import traceback
 from pathlib import Path
+from bisect import bisect_left
 from collections import defaultdict
+from functools import lru_cache
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -49,6 +51,43 @@ def fps_to_str(fps):
         return str(int(round(fps)))
     return f"{fps:.3f}".rstrip('0').rstrip('.')
 
+
+_TC_RE = re.compile(r"(\d+):(\d+):(\d+)[:;](\d+)")
+
+
+@lru_cache(maxsize=None)
+def timecode_base(fps_str):
+    """Return the integer frame base Timecode uses for fps_str, or None for drop-frame rates."""
+    tc = Timecode(fps_str, "00:00:01:00")
+    if tc.drop_frame:
+        return None
+    return tc.frames - 1
+
+
+def frames_to_tc(frames, fps_str):
+    """Format a 1-based frame count like repr(Timecode(fps_str, frames=frames)).
+
+    Non-drop rates are formatted with integer divmod; drop-frame rates
+    go through Timecode.
+    """
+    base = timecode_base(fps_str)
+    if base is None:
+        return repr(Timecode(fps_str, frames=frames))
+    total_seconds, ff = divmod(frames - 1, base)
+    total_minutes, ss = divmod(total_seconds, 60)
+    hh, mm = divmod(total_minutes, 60)
+    return f"{hh % 24:02d}:{mm:02d}:{ss:02d}:{ff:02d}"
+
+
+def tc_to_frames(tc, fps_str):
+    """Return Timecode(fps_str, tc).frames, parsing non-drop timecodes with integer math."""
+    base = timecode_base(fps_str)
+    m = _TC_RE.fullmatch(tc) if base is not None and isinstance(tc, str) else None
+    if m is None:
+        return Timecode(fps_str, tc).frames
+    hh, mm, ss, ff = map(int, m.groups())
+    return ((hh * 60 + mm) * 60 + ss) * base + ff + 1
+
 def safe_get(d, k, default=None):
     try:
         return d.get(k, default)
@@ -58,11 +97,12 @@ def safe_get(d, k, default=None):
 
 def transition_is_enveloped(transitions, elem_start, elem_end,
                              shot_start, shot_end, edge):
-    """Return whether the frame counter contains the transition at a clip edge."""
+    """Return whether the frame counter contains the transition at a clip edge.
+
+    transitions are (start, end) timeline frame pairs.
+    """
     boundary = elem_start if edge == "in" else elem_end
-    for transition in transitions:
-        trans_start = transition.GetStart(False)
-        trans_end = transition.GetEnd(False)
+    for trans_start, trans_end in transitions:
         if edge == "in":
             attached_to_edge = trans_start <= boundary < trans_end
         else:
@@ -88,17 +128,19 @@ def get_sequence_name(shot_code):
         return 'sequence_name'
 
 def shot_editorial_name_from_bg(bg_elements):
-    """Pick the ScanBg reel name for the shot (earliest bg element)."""
+    """Pick the ScanBg reel name for the shot (earliest bg element).
+
+    bg_elements are in timeline order, so the earliest is the first.
+    """
     if not bg_elements:
         return ""
-    e = sorted(bg_elements, key=lambda x: (x["TimelineStart"], x["TimelineEnd"]))[0]
-    return e.get("ReelName", "") or ""
+    return bg_elements[0].get("ReelName", "") or ""
 
 def best_bg_cut_in_tc(bg_elements, fps):
     """Choose Cut In TC from ScanBg (track 1). Prefer the element that starts closest to the shot start."""
     if not bg_elements:
         return ""
-    e = sorted(bg_elements, key=lambda x: x["ClipInFrames"])[0]
+    e = min(bg_elements, key=lambda x: x["ClipInFrames"])
     return e["ClipInTC"]
 
 def parse_edl(edl_path, fps_str):
@@ -224,13 +266,13 @@ def parse_edl(edl_path, fps_str):
     return events
 
 
-def get_clip_tc_from_edl(timeline_item, fps, edl_event=None):
+def get_clip_tc_from_edl(timeline_item, fps, edl_event=None, clip_props=None):
     fps_str = fps_to_str(fps)
     try:
-        src_in_frames  = Timecode(fps_str, edl_event['src_in']).frames - 1   # 0-indexed inclusive
-        src_out_frames = Timecode(fps_str, edl_event['src_out']).frames - 2  # EDL out is exclusive
-        rec_in_frames  = Timecode(fps_str, edl_event['rec_in']).frames - 1
-        rec_out_frames = Timecode(fps_str, edl_event['rec_out']).frames - 1
+        src_in_frames  = tc_to_frames(edl_event['src_in'], fps_str) - 1   # 0-indexed inclusive
+        src_out_frames = tc_to_frames(edl_event['src_out'], fps_str) - 2  # EDL out is exclusive
+        rec_in_frames  = tc_to_frames(edl_event['rec_in'], fps_str) - 1
+        rec_out_frames = tc_to_frames(edl_event['rec_out'], fps_str) - 1
         dur = rec_out_frames - rec_in_frames
 
         dissolve_out = edl_event.get('dissolve_out', 0)
@@ -239,36 +281,42 @@ def get_clip_tc_from_edl(timeline_item, fps, edl_event=None):
             rec_out_frames += dissolve_out * 2
             dur            += dissolve_out * 2
         return {
-            "ClipInTC":      repr(Timecode(fps_str, frames=max(1, src_in_frames + 1))),
+            "ClipInTC":      frames_to_tc(max(1, src_in_frames + 1), fps_str),
             "ClipInFrames":  src_in_frames,
-            "ClipOutTC":     repr(Timecode(fps_str, frames=max(1, src_out_frames + 1))),
+            "ClipOutTC":     frames_to_tc(max(1, src_out_frames + 1), fps_str),
             "ClipOutFrames": src_out_frames,
             "ClipDuration":  dur,
         }
     except Exception:
-        return read_clip_tc(timeline_item, fps)
+        return read_clip_tc(timeline_item, fps, clip_props)
 
-def read_clip_tc(timeline_item, fps):
+def read_clip_tc(timeline_item, fps, clip_props=None):
+    """clip_props are the item's media pool clip properties when the caller already has them."""
 
     fps_str = fps_to_str(fps)
     dur     = int(timeline_item.GetDuration())
     
     # ── MediaPoolItem path ─────────────────────────────────────────────────
-    mpi = timeline_item.GetMediaPoolItem()
-    if mpi:
+    if clip_props is None:
+        mpi = timeline_item.GetMediaPoolItem()
         try:
-            props        = mpi.GetClipProperty() or {}
+            clip_props = (mpi.GetClipProperty() or {}) if mpi else None
+        except Exception:
+            clip_props = None
+    if clip_props is not None:
+        try:
+            props        = clip_props
             src_fps_str  = props.get("FPS") or fps_str
             src_fps      = float(src_fps_str)
             start_tc_str = props.get("Start TC") or "00:00:00:00"
             # 0-indexed absolute frame of the clip's first source frame
-            mpi_start    = Timecode(fps_to_str(src_fps), start_tc_str).frames# - 1
+            mpi_start    = tc_to_frames(start_tc_str, fps_to_str(src_fps))# - 1
             src_in_frames  = mpi_start + int(timeline_item.GetSourceStartFrame())
             src_out_frames = src_in_frames + dur - 1
             return {
-                "ClipInTC":      repr(Timecode(fps_str, frames=max(1, src_in_frames + 1))),
+                "ClipInTC":      frames_to_tc(max(1, src_in_frames + 1), fps_str),
                 "ClipInFrames":  src_in_frames,
-                "ClipOutTC":     repr(Timecode(fps_str, frames=max(1, src_out_frames + 1))),
+                "ClipOutTC":     frames_to_tc(max(1, src_out_frames + 1), fps_str),
                 "ClipOutFrames": src_out_frames,
                 "ClipDuration":  dur,
             }
@@ -284,9 +332,9 @@ def read_clip_tc(timeline_item, fps):
     src_out_frames = src_in_frames + dur - 1
 
     return {
-        "ClipInTC":      repr(Timecode(fps_str, frames=max(1, src_in_frames + 1))),
+        "ClipInTC":      frames_to_tc(max(1, src_in_frames + 1), fps_str),
         "ClipInFrames":  src_in_frames,
-        "ClipOutTC":     repr(Timecode(fps_str, frames=max(1, src_out_frames + 1))),
+        "ClipOutTC":     frames_to_tc(max(1, src_out_frames + 1), fps_str),
         "ClipOutFrames": src_out_frames,
         "ClipDuration":  dur,
     }
@@ -301,9 +349,8 @@ def _fmt_percent(val):
     return f"{int(round(p))}%" if abs(p - round(p)) < 1e-6 else f"{p:.2f}%"
 
 def retime_summary(elements_by_track, fps, scan_handle):
+    """Merge retimed runs per track; each track's elements are in timeline order."""
     for track_num, track in elements_by_track.items():
-        track.sort(key=lambda e: (e["TimelineStart"], e["TimelineEnd"]))
-
         for clip in track:
             edl_event = clip.get("EDLEvent")
 
@@ -350,7 +397,7 @@ def retime_summary(elements_by_track, fps, scan_handle):
                     total_length += n
                 
                 updated_clip_out_frames = first["ClipInFrames"] + total_length - 1
-                updated_clip_out_tc = repr(Timecode(fps_to_str(fps), frames = (updated_clip_out_frames + 1)))
+                updated_clip_out_tc = frames_to_tc(updated_clip_out_frames + 1, fps_to_str(fps))
                 updated_tail_out = first["ClipIn"] + total_length + scan_handle - 1
 
                 if len(group) > 1:
@@ -419,39 +466,42 @@ def load_old_shot_list_excel(excel_path, fps):
     E=Change to Cut, F=Work In, G=Cut In, H=Cut Out, I=Work Out,
     J=Cut Duration, K=Bg Retime, L=Fg Retime, M=Cut In TC
     """
-    wb = load_workbook(excel_path, read_only=True)
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
     try:
         ws = wb["Shots"]
     except KeyError:
         ws = wb.active
 
-    old_shots = {}
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        if not row or len(row) < 13:
-            continue
-        shot_code = row[3]  # Column D
-        if not shot_code or not str(shot_code).strip():
-            continue
-
-        cut_in = int(row[6]) if row[6] is not None else None
-        cut_out = int(row[7]) if row[7] is not None else None
-        cut_in_tc = str(row[12]).strip() if row[12] else ""
-
-        cut_in_tc_frames = None
-        if cut_in_tc:
-            try:
-                cut_in_tc_frames = Timecode(fps_to_str(fps), cut_in_tc).frames
-            except Exception:
-                pass
+    # Release the zip handle even if a row fails to convert
+    try:
+        old_shots = {}
+        for row in ws.iter_rows(min_row=2, values_only=True):
+            if not row or len(row) < 13:
+                continue
+            shot_code = row[3]  # Column D
+            if not shot_code or not str(shot_code).strip():
+                continue
 
-        old_shots[str(shot_code).strip()] = {
-            'CutIn': cut_in,
-            'CutOut': cut_out,
-            'CutInTC': cut_in_tc,
-            'CutInTCFrames': cut_in_tc_frames,
-        }
+            cut_in = int(row[6]) if row[6] is not None else None
+            cut_out = int(row[7]) if row[7] is not None else None
+            cut_in_tc = str(row[12]).strip() if row[12] else ""
+
+            cut_in_tc_frames = None
+            if cut_in_tc:
+                try:
+                    cut_in_tc_frames = tc_to_frames(cut_in_tc, fps_to_str(fps))
+                except Exception:
+                    pass
+
+            old_shots[str(shot_code).strip()] = {
+                'CutIn': cut_in,
+                'CutOut': cut_out,
+                'CutInTC': cut_in_tc,
+                'CutInTCFrames': cut_in_tc_frames,
+            }
+    finally:
+        wb.close()
 
-    wb.close()
     return old_shots
 
 def compare_with_old_excel(current_shots, old_shots_dict):
@@ -544,7 +594,11 @@ class ShotListWorker(QThread):
                 self.finished.emit(False,
                     f"No clips found on Frame Counter Track {self.frame_counter_track}")
                 return
-            fc_items_sorted = sorted(fc_items, key=lambda c: c.GetStart(False))
+            # Read each frame counter's span once; the shot loop reuses it
+            fc_items_sorted = sorted(
+                ((c.GetStart(False), c.GetEnd(False), c) for c in fc_items),
+                key=lambda span: span[0]
+            )
             self.log(f"Found {len(fc_items_sorted)} frame counter clips on track {self.frame_counter_track}")
 
             def lookup_edl_event(track_num, index):
@@ -561,6 +615,7 @@ class ShotListWorker(QThread):
 
             track_items = {}
             track_transitions = {}
+            track_spans = {}
             # Resolve transition names — these appear as timeline items but are not clips
             # and have no entry in the EDL. Extend this set if new transition types appear.
             RESOLVE_TRANSITIONS = {
@@ -570,12 +625,23 @@ class ShotListWorker(QThread):
 
             for i in element_tracks:
                 all_items = timeline.GetItemListInTrack("video", i) or []
+                names = [it.GetName() for it in all_items]
                 track_transitions[i] = [
-                    it for it in all_items if it.GetName() in RESOLVE_TRANSITIONS
+                    (it.GetStart(False), it.GetEnd(False))
+                    for it, name in zip(all_items, names) if name in RESOLVE_TRANSITIONS
                 ]
                 # Exclude built-in transitions; keep all other items (clips, generators,
                 # placeholders) so index alignment with the EDL is preserved.
-                track_items[i] = [it for it in all_items if it.GetName() not in RESOLVE_TRANSITIONS]
+                track_items[i] = [
+                    it for it, name in zip(all_items, names) if name not in RESOLVE_TRANSITIONS
+                ]
+                # Index clips by timeline start so each shot only visits the clips
+                # it can contain; edl_idx keeps the position in track_items
+                spans = sorted(
+                    (it.GetStart(False), it.GetEnd(False), edl_idx)
+                    for edl_idx, it in enumerate(track_items[i])
+                )
+                track_spans[i] = ([span[0] for span in spans], spans)
 
             # Process each shot
             shots_rows = []
@@ -584,14 +650,12 @@ class ShotListWorker(QThread):
 
             # {something}_in / out: VFX frame number, out is inclusive
             # {something}_start / end: raw frame number, end is non-inclusive
-            for fc_item in fc_items_sorted:
+            for shot_start, shot_end, fc_item in fc_items_sorted:
                 shot_code = (fc_item.GetName() or "").strip()
                 if not shot_code:
                     continue
 
                 cut_order += 1
-                shot_start = fc_item.GetStart(False)
-                shot_end = fc_item.GetEnd(False)
                 shot_dur = shot_end - shot_start
 
                 self.log(f"==== Cut {cut_order}: {shot_code} [{shot_start}-{shot_end}] ====")
@@ -600,15 +664,22 @@ class ShotListWorker(QThread):
                 cut_out = cut_in + int(shot_dur) - 1
                 self.log(f"  Cut In={cut_in}, Cut Out={cut_out}")
 
-                # Collect elements on [bottom..top] tracks
+                # Collect elements on [bottom..top] tracks; the span index yields
+                # them in (TimelineStart, TimelineEnd) order, which later steps rely on
                 elements_by_track = defaultdict(list)
                 first_elem_in_shot = True
 
                 for track in element_tracks:
 
-                    for edl_idx, elem in enumerate(track_items.get(track) or []):
-                        elem_start = elem.GetStart(False)
-                        elem_end   = elem.GetEnd(False)
+                    items = track_items.get(track) or []
+                    starts, spans = track_spans.get(track, ([], []))
+                    for pos in range(bisect_left(starts, shot_start), len(spans)):
+                        elem_start, elem_end, edl_idx = spans[pos]
+                        if elem_start > shot_end:
+                            break
+                        if elem_end > shot_end:
+                            continue
+                        elem = items[edl_idx]
 
                         # Skip disabled elems
                         try:
@@ -618,8 +689,8 @@ class ShotListWorker(QThread):
                             pass
 
                         mpi = elem.GetMediaPoolItem()
-                        mpi_props = (mpi.GetClipProperty() if mpi else {}) or {}
-                        reel = mpi_props["File Name"] if mpi_props != {} else elem.GetName()
+                        clip_props = (mpi.GetClipProperty() or {}) if mpi else None
+                        reel = clip_props["File Name"] if clip_props else elem.GetName()
                         elem_edl_event = lookup_edl_event(track, edl_idx)
 
                         if elem_edl_event is None:
@@ -629,80 +700,78 @@ class ShotListWorker(QThread):
                         if elem_edl_event.get('clip_name'):
                             reel = elem_edl_event['clip_name']
 
-                        if elem_start >= shot_start and elem_end <= shot_end:
+                        tc_info = get_clip_tc_from_edl(elem, fps, elem_edl_event, clip_props)
 
-                            tc_info = get_clip_tc_from_edl(elem, fps, elem_edl_event)
+                        elem_dur = tc_info["ClipDuration"]
+                        elem_in = int(fc_tc_info['ClipInFrames'] + elem_start - shot_start)
 
-                            elem_dur = tc_info["ClipDuration"]
-                            elem_in = int(fc_tc_info['ClipInFrames'] + elem_start - shot_start)
-
-                            if "dissolve_in" in elem_edl_event:
-                                dissolve_is_enveloped = transition_is_enveloped(
-                                    track_transitions.get(track, []),
-                                    elem_start, elem_end, shot_start, shot_end, "in"
+                        if "dissolve_in" in elem_edl_event:
+                            dissolve_is_enveloped = transition_is_enveloped(
+                                track_transitions.get(track, []),
+                                elem_start, elem_end, shot_start, shot_end, "in"
+                            )
+                            if dissolve_is_enveloped:
+                                self.log(
+                                    f"  {reel}: incoming dissolve is inside the "
+                                    "frame counter; keeping Cut In unchanged"
                                 )
-                                if dissolve_is_enveloped:
-                                    self.log(
-                                        f"  {reel}: incoming dissolve is inside the "
-                                        "frame counter; keeping Cut In unchanged"
-                                    )
-                                else:
-                                    if first_elem_in_shot:
-                                        elem_in -= elem_edl_event['dissolve_in']
-                                    cut_in -= elem_edl_event['dissolve_in']
-                            elem_out = int(elem_in + elem_dur - 1)
-
-                            if "dissolve_out" in elem_edl_event:
-                                dissolve_is_enveloped = transition_is_enveloped(
-                                    track_transitions.get(track, []),
-                                    elem_start, elem_end, shot_start, shot_end, "out"
+                            else:
+                                if first_elem_in_shot:
+                                    elem_in -= elem_edl_event['dissolve_in']
+                                cut_in -= elem_edl_event['dissolve_in']
+                        elem_out = int(elem_in + elem_dur - 1)
+
+                        if "dissolve_out" in elem_edl_event:
+                            dissolve_is_enveloped = transition_is_enveloped(
+                                track_transitions.get(track, []),
+                                elem_start, elem_end, shot_start, shot_end, "out"
+                            )
+                            if dissolve_is_enveloped:
+                                self.log(
+                                    f"  {reel}: outgoing dissolve is inside the "
+                                    "frame counter; keeping Cut Out unchanged"
                                 )
-                                if dissolve_is_enveloped:
-                                    self.log(
-                                        f"  {reel}: outgoing dissolve is inside the "
-                                        "frame counter; keeping Cut Out unchanged"
-                                    )
-                                else:
-                                    cut_out += elem_edl_event['dissolve_out']
-                            first_elem_in_shot = False
-
-                            retime_fps = elem_edl_event.get('retime_fps')
-                            if retime_fps is not None:
-                                # CMX 3600: M2 fps = source frames per timeline second
-                                speed     = retime_fps / fps
-                                has_retime = abs(speed - 1.0) > 1e-3
                             else:
-                                # No M2 line → definitively 100% speed
-                                speed      = 1.0
-                                has_retime = False
-
-                            props = elem.GetProperty() or {}
-
-                            elements_by_track[track].append({
-                                "TrackIndex":    track,
-                                "ShotCode":      shot_code,
-                                "ElementName":   element_labels[track],
-                                "TimelineItem":  elem,
-                                "TimelineStart": elem_start,
-                                "TimelineEnd":   elem_end,
-                                "ClipIn":        elem_in,
-                                "ClipOut":       elem_out,
-                                "ClipInTC":      tc_info["ClipInTC"],
-                                "ClipOutTC":     tc_info["ClipOutTC"],
-                                "ClipInFrames":  tc_info["ClipInFrames"],
-                                "ClipOutFrames": tc_info["ClipOutFrames"],
-                                "ClipDuration":  elem_dur,
-                                "HasRetime":     has_retime,
-                                "Speed":         speed,
-                                "RetimeSummary": "",
-                                "RetimeFPS":     (fps * speed) if speed is not None else None,
-                                "ScaleRepo":     summarize_scale_repo(props),
-                                "ReelName":      reel,
-                                "Props":         props,
-                                "HeadIn":        int(elem_in  - self.scan_handle),
-                                "TailOut":       int(elem_out + self.scan_handle),
-                                "EDLEvent":      elem_edl_event,
-                            })
+                                cut_out += elem_edl_event['dissolve_out']
+                        first_elem_in_shot = False
+
+                        retime_fps = elem_edl_event.get('retime_fps')
+                        if retime_fps is not None:
+                            # CMX 3600: M2 fps = source frames per timeline second
+                            speed     = retime_fps / fps
+                            has_retime = abs(speed - 1.0) > 1e-3
+                        else:
+                            # No M2 line → definitively 100% speed
+                            speed      = 1.0
+                            has_retime = False
+
+                        props = elem.GetProperty() or {}
+
+                        elements_by_track[track].append({
+                            "TrackIndex":    track,
+                            "ShotCode":      shot_code,
+                            "ElementName":   element_labels[track],
+                            "TimelineItem":  elem,
+                            "TimelineStart": elem_start,
+                            "TimelineEnd":   elem_end,
+                            "ClipIn":        elem_in,
+                            "ClipOut":       elem_out,
+                            "ClipInTC":      tc_info["ClipInTC"],
+                            "ClipOutTC":     tc_info["ClipOutTC"],
+                            "ClipInFrames":  tc_info["ClipInFrames"],
+                            "ClipOutFrames": tc_info["ClipOutFrames"],
+                            "ClipDuration":  elem_dur,
+                            "HasRetime":     has_retime,
+                            "Speed":         speed,
+                            "RetimeSummary": "",
+                            "RetimeFPS":     (fps * speed) if speed is not None else None,
+                            "ScaleRepo":     summarize_scale_repo(props),
+                            "ReelName":      reel,
+                            "Props":         props,
+                            "HeadIn":        int(elem_in  - self.scan_handle),
+                            "TailOut":       int(elem_out + self.scan_handle),
+                            "EDLEvent":      elem_edl_event,
+                        })
 
                 # Shot metadata from BG elements (lowest element track)
                 bottom_track = element_tracks[0] if element_tracks else None
@@ -745,7 +814,7 @@ class ShotListWorker(QThread):
                 })
 
                 for track in element_tracks:
-                    for e in sorted(elements_by_track.get(track, []), key=lambda x: (x["TimelineStart"], x["TimelineEnd"])):
+                    for e in elements_by_track.get(track, []):
                         elements_rows.append({
                             "Sequence": sequence,
                             "CutOrder": cut_order,
@@ -779,48 +848,54 @@ class ShotListWorker(QThread):
             self.log("")
             self.log("Writing Excel...")
 
-            wb = Workbook()
-            ws_shots = wb.active
-            ws_shots.title = "Shots"
+            wb = Workbook(write_only=True)
             shots_cols = [
                 "Sequence", "Cut Order", "Editorial Name", "Shot Code", "Change to Cut",
                 "Work In", "Cut In", "Cut Out", "Work Out",
                 "Cut Duration", "Bg Retime", "Fg Retime", "Cut In TC"
             ]
-            ws_shots.append(shots_cols)
+            shots_values = [shots_cols]
+            shots_widths = [len(c) for c in shots_cols]
             for r in shots_rows:
-                ws_shots.append([
+                row = [
                     r["Sequence"], r["CutOrder"], r["EditorialName"], r["ShotCode"], r["ChangeToCut"],
                     r["WorkIn"], r["CutIn"], r["CutOut"], r["WorkOut"],
                     r["CutDuration"], r["BgRetime"], r["FgRetime"], r["CutInTC"]
-                ])
+                ]
+                for i, val in enumerate(row):
+                    if val is not None:
+                        shots_widths[i] = max(shots_widths[i], len(str(val)))
+                shots_values.append(row)
 
-            ws_elems = wb.create_sheet(title="Elements")
             elems_cols = [
                 "Sequence", "Cut Order", "Editorial Name", "Shot Code", "Element",
                 "Cut In", "Cut Out", "Clip Duration (with dissolve before retime)",
                 "Clip In TC", "Clip In Frames", "Clip In", "Clip Out", "Clip Out Frames", "Clip Out TC",
                 "ScanIn", "ScanOut", "Retime Summary", "Scale & Repo"
             ]
-            ws_elems.append(elems_cols)
+            elems_values = [elems_cols]
+            elems_widths = [len(c) for c in elems_cols]
             for r in elements_rows:
-                ws_elems.append([
+                row = [
                     r["Sequence"], r["CutOrder"], r["EditorialName"], r["ShotCode"], r["Element"],
                     r["ShotCutIn"], r["ShotCutOut"], r['ClipDuration'],
                     r["ClipInTC"], r["ClipInFrames"], r["ClipIn"], r["ClipOut"], r["ClipOutFrames"], r["ClipOutTC"],
                     r["ClipHeadIn"], r["ClipTailOut"], r["Retime"], r["ScaleRepo"]
-                ])
-
-            # Auto-width
-            for ws in (ws_shots, ws_elems):
-                for col_idx, _ in enumerate(ws[1], start=1):
-                    max_len = 0
-                    for row in ws.iter_rows(min_col=col_idx, max_col=col_idx):
-                        val = row[0].value
-                        if val is None:
-                            continue
-                        max_len = max(max_len, len(str(val)))
+                ]
+                for i, val in enumerate(row):
+                    if val is not None:
+                        elems_widths[i] = max(elems_widths[i], len(str(val)))
+                elems_values.append(row)
+
+            # Write-only sheets stream rows straight to disk, so the auto-width
+            # is tracked while building the rows and set before the first append
+            for title, values, widths in (("Shots", shots_values, shots_widths),
+                                          ("Elements", elems_values, elems_widths)):
+                ws = wb.create_sheet(title)
+                for col_idx, max_len in enumerate(widths, start=1):
                     ws.column_dimensions[get_column_letter(col_idx)].width = min(max(12, max_len + 2), 50)
+                for row in values:
+                    ws.append(row)
 
             out_path = os.path.abspath(self.output_path)
             wb.save(out_path)